@@ -2,41 +2,308 @@ import tkinter as tk
 from tkinter import messagebox, filedialog
 from tkinter import ttk # For Treeview for better table display
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from pandas.api.types import is_string_dtype, union_categoricals
 import os
+import re
+import csv
+import functools
+import itertools
+import concurrent.futures
 from datetime import datetime, timedelta
 import numpy as np # For statistical calculations like mode
 
+try:
+    import pyarrow # Optional: enables the Parquet data store and multi-threaded CSV parsing
+    import pyarrow.csv
+except ImportError:
+    pyarrow = None
+
+def _cached_query(method):
+    """
+    Memoizes a DataManager query on its arguments. The same filters always produce the same
+    result until the data changes, so repeat views skip the filter and groupby entirely.
+    Cached results are shared with callers, which must treat them as read-only.
+    Queries run on page worker threads, so the data may be replaced while one is computing: the result
+    goes into the cache that was current when it started, which the sales_data setter has discarded
+    by then, so a stale result can never be served for the new data.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        cache = self._agg_cache
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = method(self, *args, **kwargs)
+            return result
+        except TypeError: # Unhashable arguments: compute without caching
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def _write_csv(df, file_path):
+    """
+    Writes df to a CSV file without its index. pandas' writer is used even when pyarrow is installed:
+    Arrow's writer quotes every string cell and drops the '.0' of whole floats, so its files would
+    differ from the exports users already have.
+    """
+    df.to_csv(file_path, index=False)
+
+def _write_excel(df, file_path):
+    """
+    Writes df to an .xlsx file without its index. openpyxl's write-only workbook streams rows straight
+    to the file instead of building a styled cell object for each value as pandas' to_excel does.
+    Float columns (prices and revenue) are written as float64 rounded to cents, so a narrower source
+    dtype can't leak binary noise such as 150.10000610351562 into the sheet.
+    """
+    from openpyxl import Workbook # Same optional dependency pandas uses for .xlsx files
+    float_columns = df.select_dtypes('floating').columns
+    df = df.astype({col: 'float64' for col in float_columns}).round({col: 2 for col in float_columns})
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Sheet1')
+    sheet.append(list(df.columns))
+    for row in df.itertuples(index=False, name=None):
+        sheet.append(row)
+    workbook.save(file_path)
+
+def _write_partitioned(writer, df, file_path, column):
+    """
+    Writes df with writer(part, path) as one file per value of column, named '<name>_<value><ext>'
+    after file_path. The files are written concurrently, so their disk writes overlap instead of
+    running one after another.
+    Characters a filename can't hold (e.g. '/' in a branch name) are replaced with '_'; values that
+    end up with the same name get a numbered suffix rather than overwriting each other's file.
+    """
+    stem, ext = os.path.splitext(file_path)
+    used_names = set()
+    with concurrent.futures.ThreadPoolExecutor() as pool:
+        futures = []
+        for value, part in df.groupby(column, observed=True):
+            name = base_name = re.sub(r'[^\w.-]', '_', str(value))
+            suffix = itertools.count(2)
+            while name in used_names:
+                name = f"{base_name}_{next(suffix)}"
+            used_names.add(name)
+            futures.append(pool.submit(writer, part, f"{stem}_{name}{ext}"))
+        for future in futures:
+            future.result() # Re-raises the first write error, if any
+
+def _write_pdf_summary(df, file_path, title, max_rows=20):
+    """
+    Saves the first max_rows rows of df as a one-page PDF table. Only a pyplot-free Figure is used,
+    so this can run on a page's worker thread while the Tk thread stays responsive.
+    """
+    from matplotlib.figure import Figure # Imported on first use, see BasePage._ensure_chart
+    # Full dataframe to PDF is complex and typically requires external libraries like ReportLab or FPDF.
+    fig = Figure(figsize=(11, 8.5)) # Standard paper size
+    ax = fig.add_subplot()
+    ax.axis('off')
+    ax.set_title(title, fontsize=14, pad=20)
+
+    # Prepare data for table: limit columns and rows for readability in PDF.
+    # Slice first, so dates are only formatted for the rows actually shown.
+    display_df = df.head(max_rows)
+    if 'Date' in display_df.columns:
+        display_df = display_df.assign(Date=display_df['Date'].dt.strftime('%Y-%m-%d')) # Format date for display
+
+    table = ax.table(cellText=display_df.values, colLabels=display_df.columns, loc='center', cellLoc='left')
+    table.auto_set_font_size(False)
+    table.set_fontsize(8)
+    table.scale(1.2, 1.2) # Adjust size
+
+    fig.savefig(file_path, bbox_inches='tight', pad_inches=0.5)
+
+# Shared results for queries that match no rows. Like cached results, callers treat them as read-only.
+_EMPTY_MONTHLY = pd.DataFrame(columns=['Product', 'Quantity', 'UnitPrice', 'Total'])
+_EMPTY_PRICE_HISTORY = pd.DataFrame(columns=['Date', 'UnitPrice'])
+_EMPTY_PREFERENCES = pd.DataFrame(columns=['Product', 'UnitsSold', 'Revenue'])
+_EMPTY_DISTRIBUTION = pd.Series(dtype='float64')
+
+def _guard_empty(empty_result):
+    """
+    Returns empty_result from a DataManager query when there is no sales data at all, or when the
+    query itself comes back empty, so each query method only implements the non-empty case.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.sales_data.empty:
+                return empty_result
+            result = method(self, *args, **kwargs)
+            return empty_result if result.empty else result
+        return wrapper
+    return decorator
+
 # --- Data Management Class ---
 # S (Single Responsibility Principle): This class is solely responsible for data loading, saving, and providing
 # filtered/aggregated data to the UI components. It doesn't handle any UI logic.
 class DataManager:
     """Manages all sales data operations, including loading, saving, and querying."""
-    def __init__(self, data_file="sales_data.csv"):
+    # Calendar parts derived from 'Date' once per row so queries filter on small integers
+    # instead of re-decoding the datetime column on every call. They are never written to disk.
+    DERIVED_COLUMNS = ['Year', 'Month', 'DayOfWeek']
+    # Columns kept in the data file, in file order
+    STORED_COLUMNS = ['Date', 'Branch', 'Product', 'Quantity', 'UnitPrice', 'Total']
+    DAYS_OF_WEEK = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    # Low-cardinality string keys stored as categoricals so filters and groupbys work on integer codes
+    CATEGORY_COLUMNS = ['Branch', 'Product']
+    # Fixed named-aggregation spec for the monthly pre-aggregates (see _monthly_totals), built once:
+    # sum quantity and total; unit prices are summed and counted so their average can be recombined
+    MONTHLY_AGGREGATIONS = {
+        'Quantity': ('Quantity', 'sum'),
+        'UnitPriceSum': ('UnitPrice', 'sum'),
+        'Sales': ('UnitPrice', 'count'),
+        'Total': ('Total', 'sum'),
+    }
+
+    def __init__(self, data_file="sales_data.parquet"):
+        # data_file=None keeps the data in memory only: nothing is loaded at start or saved on import
+        if self._is_parquet(data_file) and pyarrow is None:
+            # Parquet support needs pyarrow; keep using the CSV store of the same name instead
+            data_file = os.path.splitext(data_file)[0] + ".csv"
         self.data_file = data_file
+        self._agg_cache = {} # Query results keyed by (method, arguments); see _cached_query
         self.sales_data = self._load_data()
+        if self._is_parquet(self.data_file) and not os.path.exists(self.data_file) and not self.sales_data.empty:
+            self._save_data() # Data came from a legacy CSV store: migrate it to Parquet once
+
+    @property
+    def sales_data(self):
+        """The full sales table. Assigning a new frame invalidates all cached query results."""
+        return self._sales_data
+
+    @sales_data.setter
+    def sales_data(self, df):
+        self._sales_data = df
+        self._agg_cache = {} # A fresh dict, so queries still running on the old data can't fill it (see _cached_query)
+        # Running all-time totals for the dashboard summary: rebuilt on the next get_sales_summary call,
+        # and kept up to date incrementally by add_data
+        self._summary_totals = None
+
+    @staticmethod
+    def _is_parquet(path):
+        """Returns True if the given data file uses the Parquet format."""
+        return path is not None and path.lower().endswith(".parquet")
 
     def _load_data(self):
-        """Loads sales data from the specified CSV file. Returns empty DataFrame if file not found or error."""
-        if os.path.exists(self.data_file):
+        """
+        Loads sales data from the data file (Parquet or CSV). If a Parquet store does not exist yet,
+        a legacy CSV file with the same name is loaded instead. Returns empty DataFrame if file not found or error.
+        """
+        source_file = self.data_file
+        if source_file is None:
+            return pd.DataFrame(columns=self.STORED_COLUMNS)
+        if self._is_parquet(source_file) and not os.path.exists(source_file):
+            source_file = os.path.splitext(source_file)[0] + ".csv"
+
+        if os.path.exists(source_file):
             try:
-                # Assuming CSV has columns: Date, Branch, Product, Quantity, UnitPrice, Total
-                # 'Date' is parsed as datetime, 'Total' and 'Quantity' as numeric
-                df = pd.read_csv(self.data_file, parse_dates=['Date'])
-                df['Quantity'] = pd.to_numeric(df['Quantity'], errors='coerce')
-                df['UnitPrice'] = pd.to_numeric(df['UnitPrice'], errors='coerce')
-                df['Total'] = pd.to_numeric(df['Total'], errors='coerce')
+                if self._is_parquet(source_file):
+                    # Parquet stores typed columns, so no date parsing or numeric coercion is needed.
+                    # Only the stored columns are read, straight from a memory map of the file.
+                    df = pd.read_parquet(source_file, engine="pyarrow", columns=self.STORED_COLUMNS, memory_map=True)
+                else:
+                    # Assuming CSV has columns: Date, Branch, Product, Quantity, UnitPrice, Total
+                    # 'Date' is parsed as datetime, 'Total' and 'Quantity' as numeric
+                    df = self._read_csv(source_file)
+                    df['Quantity'] = pd.to_numeric(df['Quantity'], errors='coerce')
+                    df['UnitPrice'] = pd.to_numeric(df['UnitPrice'], errors='coerce')
+                    df['Total'] = pd.to_numeric(df['Total'], errors='coerce')
                 # Drop rows where essential numeric data is missing
-                df.dropna(subset=['Date', 'Branch', 'Product', 'Quantity', 'UnitPrice', 'Total'], inplace=True)
-                return df
+                df.dropna(subset=self.STORED_COLUMNS, inplace=True)
+                if df.empty:
+                    # Nothing to type: a header-only file leaves 'Date' unparsed, without date parts to derive
+                    return pd.DataFrame(columns=self.STORED_COLUMNS)
+                df = self._encode_keys(df)
+                self._narrow_numeric(df)
+                # Keep the table ordered by date so range filters can binary-search it (see _date_slice).
+                # A Parquet store is saved in that order already, so it is only sorted if needed.
+                if not df['Date'].is_monotonic_increasing:
+                    df.sort_values('Date', kind='stable', inplace=True, ignore_index=True)
+                else:
+                    df.reset_index(drop=True, inplace=True)
+                return self._add_date_parts(df)
             except Exception as e:
-                messagebox.showerror("Data Load Error", f"Failed to load data from {self.data_file}: {e}\nStarting with empty data.")
+                messagebox.showerror("Data Load Error", f"Failed to load data from {source_file}: {e}\nStarting with empty data.")
                 # Return an empty DataFrame with expected columns if loading fails
-                return pd.DataFrame(columns=['Date', 'Branch', 'Product', 'Quantity', 'UnitPrice', 'Total'])
+                return pd.DataFrame(columns=self.STORED_COLUMNS)
         else:
             # Return an empty DataFrame if file doesn't exist
-            return pd.DataFrame(columns=['Date', 'Branch', 'Product', 'Quantity', 'UnitPrice', 'Total'])
+            return pd.DataFrame(columns=self.STORED_COLUMNS)
+
+    def _read_csv(self, path):
+        """
+        Reads a CSV store with 'Date' parsed and the string keys dictionary-encoded by the parser itself,
+        so no per-row Python string objects are created for them. pyarrow's multi-threaded reader is used
+        when installed; files it cannot type (e.g. non-ISO dates) fall back to pandas' own parser.
+        """
+        if pyarrow is not None:
+            key_type = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+            column_types = {'Date': pyarrow.timestamp('ns')}
+            column_types.update({col: key_type for col in self.CATEGORY_COLUMNS})
+            try:
+                # strings_can_be_null: empty fields become missing values, as with pandas' parser
+                convert_options = pyarrow.csv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+                table = pyarrow.csv.read_csv(path, convert_options=convert_options)
+            except pyarrow.ArrowInvalid:
+                pass
+            else:
+                df = table.to_pandas()
+                for col in self.CATEGORY_COLUMNS:
+                    if col in df.columns:
+                        # Arrow dictionaries list values in order of appearance; keep categories sorted
+                        df[col] = df[col].cat.reorder_categories(sorted(df[col].cat.categories))
+                return df
+        return pd.read_csv(path, parse_dates=['Date'], dtype={col: 'category' for col in self.CATEGORY_COLUMNS})
+
+    @classmethod
+    def _encode_keys(cls, df):
+        """
+        Returns df with the CATEGORY_COLUMNS as categoricals holding only values that occur in df.
+        Columns may already be categorical from parsing, which also records values seen only on rows
+        dropped afterwards; those would otherwise linger as categories and show up in the dropdowns.
+        Keys are always stored as strings: an Excel sheet may hold numeric branch or product codes,
+        and categories of different dtypes can't be merged with the existing data in add_data.
+        """
+        df = df.copy(deep=False)
+        for col in cls.CATEGORY_COLUMNS:
+            values = df[col]
+            if isinstance(values.dtype, pd.CategoricalDtype) and is_string_dtype(values.cat.categories):
+                values = values.cat.remove_unused_categories()
+            else:
+                values = values.astype(str).astype('category')
+            df[col] = values
+        return df
+
+    @staticmethod
+    def _parse_dates(values):
+        """
+        Converts imported date values to datetime. ISO dates ('2024-06-01', optionally with a time) take
+        pandas' fixed-format fast path; anything else falls back to per-file format inference.
+        """
+        try:
+            return pd.to_datetime(values, format='ISO8601', cache=True)
+        except ValueError:
+            return pd.to_datetime(values, cache=True)
+
+    @staticmethod
+    def _narrow_numeric(df):
+        """
+        Stores whole-number quantities as int32 (in place), halving the bytes every filter and
+        aggregation has to scan. 'UnitPrice' and 'Total' stay float64: prices are exported as stored,
+        and float32 would turn e.g. 150.1 into 150.10000610351562 in those files.
+        """
+        quantity = df['Quantity']
+        if (quantity % 1 == 0).all() and quantity.abs().max() < 2**31:
+            df['Quantity'] = quantity.astype('int32')
+        return df
+
+    @staticmethod
+    def _add_date_parts(df):
+        """Adds the precomputed 'Year', 'Month' and 'DayOfWeek' (0=Monday) columns to df in place."""
+        df['Year'] = df['Date'].dt.year.astype('int16')
+        df['Month'] = df['Date'].dt.month.astype('int8')
+        df['DayOfWeek'] = df['Date'].dt.dayofweek.astype('int8')
+        return df
 
     def add_data(self, new_df):
         """Adds new DataFrame records to the existing sales data and saves."""
@@ -48,7 +315,7 @@ class DataManager:
 
         # Ensure 'Date' is datetime and numeric columns are correctly typed before concatenating
         try:
-            new_df['Date'] = pd.to_datetime(new_df['Date'])
+            new_df['Date'] = self._parse_dates(new_df['Date'])
             new_df['Quantity'] = pd.to_numeric(new_df['Quantity'], errors='coerce')
             new_df['UnitPrice'] = pd.to_numeric(new_df['UnitPrice'], errors='coerce')
             new_df['Total'] = pd.to_numeric(new_df['Total'], errors='coerce')
@@ -62,131 +329,274 @@ class DataManager:
             messagebox.showwarning("No Valid Data", "No valid records to add after processing. Check your file for empty or malformed rows.")
             return False
 
-        self.sales_data = pd.concat([self.sales_data, new_df], ignore_index=True)
-        self._save_data()
+        self._narrow_numeric(new_df)
+        self._add_date_parts(new_df)
+        new_df = self._encode_keys(new_df)
+        summary_totals = self._summary_totals # Assigning sales_data below resets it
+        if self.sales_data.empty:
+            # Concatenating onto an empty, untyped frame would degrade the new columns to object dtype
+            self.sales_data = new_df.sort_values('Date', kind='stable', ignore_index=True)
+        else:
+            # pd.concat turns categoricals with differing categories into object; merge the category
+            # sets explicitly so the combined key columns stay categorical.
+            try:
+                merged_keys = {
+                    col: union_categoricals([self.sales_data[col], new_df[col]], sort_categories=True)
+                    for col in self.CATEGORY_COLUMNS
+                }
+            except TypeError as e:
+                messagebox.showerror("Import Error", f"Imported Branch/Product values could not be merged with the existing data: {e}")
+                return False
+            combined = pd.concat([self.sales_data, new_df], ignore_index=True)
+            for col, values in merged_keys.items():
+                combined[col] = values
+            if not combined['Date'].is_monotonic_increasing:
+                combined.sort_values('Date', kind='stable', inplace=True, ignore_index=True)
+            self.sales_data = combined
+        if summary_totals is not None:
+            # Fold only the new rows into the running summary totals instead of re-aggregating the table
+            total_sales, product_totals = summary_totals
+            for product, total in new_df.groupby('Product', observed=True)['Total'].sum().items():
+                product_totals[product] = product_totals.get(product, 0) + total
+            self._summary_totals = (total_sales + new_df['Total'].sum(), product_totals)
+        self._save_data(new_rows=new_df)
         return True
 
-    def _save_data(self):
-        """Saves the current sales data DataFrame to the CSV file."""
+    def get_sales_summary(self):
+        """
+        Returns (total_sales, top_product) over all sales data, where top_product is the product with
+        the highest total sales, or None if there is no data.
+        """
+        if self._summary_totals is None:
+            product_totals = self.sales_data.groupby('Product', observed=True)['Total'].sum().to_dict()
+            self._summary_totals = (self.sales_data['Total'].sum(), product_totals)
+        total_sales, product_totals = self._summary_totals
+        top_product = max(product_totals, key=product_totals.get) if product_totals else None
+        return total_sales, top_product
+
+    def _save_data(self, new_rows=None):
+        """
+        Saves the current sales data DataFrame to the data file (Parquet or CSV).
+        If new_rows are given and the CSV file already holds every earlier row, only new_rows are
+        appended, so an import costs time proportional to its own size rather than the whole table.
+        """
+        if self.data_file is None:
+            return
         try:
-            self.sales_data.to_csv(self.data_file, index=False)
+            stored_columns = [col for col in self.sales_data.columns if col not in self.DERIVED_COLUMNS]
+            if new_rows is not None and self._can_append_csv(stored_columns):
+                new_rows.reindex(columns=stored_columns).to_csv(self.data_file, mode='a', header=False, index=False)
+                return
+            stored_df = self.sales_data[stored_columns]
+            if self._is_parquet(self.data_file):
+                stored_df.to_parquet(self.data_file, engine="pyarrow", compression="zstd", index=False)
+            else:
+                stored_df.to_csv(self.data_file, index=False)
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save data to {self.data_file}: {e}")
 
+    def _can_append_csv(self, columns):
+        """
+        Returns True if the data file is an existing CSV whose header lists exactly these columns
+        and which ends with a complete line, so rows can be appended to it safely.
+        """
+        if self._is_parquet(self.data_file) or not os.path.exists(self.data_file):
+            return False
+        try:
+            with open(self.data_file, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    return False
+            with open(self.data_file, newline='') as f:
+                return next(csv.reader(f), None) == columns
+        except OSError:
+            return False
+
+    @_cached_query
     def get_branches(self):
-        """Returns a sorted list of unique branch names."""
-        return sorted(self.sales_data['Branch'].unique().tolist()) if not self.sales_data.empty else []
+        """Returns a sorted list of unique branch names (read from the categories, without scanning rows)."""
+        return sorted(self.sales_data['Branch'].cat.categories.tolist()) if not self.sales_data.empty else []
 
+    @_cached_query
     def get_products(self):
-        """Returns a sorted list of unique product names."""
-        return sorted(self.sales_data['Product'].unique().tolist()) if not self.sales_data.empty else []
+        """Returns a sorted list of unique product names (read from the categories, without scanning rows)."""
+        return sorted(self.sales_data['Product'].cat.categories.tolist()) if not self.sales_data.empty else []
 
+    @_cached_query
     def get_years(self):
         """Returns a sorted list of unique years present in the data."""
-        if not self.sales_data.empty and 'Date' in self.sales_data.columns:
-            return sorted(self.sales_data['Date'].dt.year.unique().tolist())
+        if not self.sales_data.empty and 'Year' in self.sales_data.columns:
+            return sorted(self.sales_data['Year'].unique().tolist())
         return [datetime.now().year] # Provide current year as a default if no data
 
-    def get_monthly_sales(self, branch=None, year=None, month=None):
+    def _date_slice(self, start, end):
         """
-        Filters sales data by branch, year, and month, then aggregates total sales per product.
-        Returns a DataFrame with 'Product' and 'Total' columns.
+        Returns the rows of sales_data dated within [start, end]. The table is kept sorted by
+        'Date', so two binary searches locate the range instead of comparing every row to both bounds.
         """
-        df = self.sales_data.copy()
-        if df.empty:
-            return pd.DataFrame(columns=['Product', 'Quantity', 'UnitPrice', 'Total'])
+        dates = self.sales_data['Date'].to_numpy()
+        lo = dates.searchsorted(pd.Timestamp(start).to_datetime64(), side='left')
+        hi = dates.searchsorted(pd.Timestamp(end).to_datetime64(), side='right')
+        return self.sales_data.iloc[lo:hi]
 
+    def _filter_mask(self, df, branch=None, year=None, month=None, product=None):
+        """
+        Builds one combined boolean mask for all active filters, so each query selects
+        its rows in a single pass instead of re-indexing the frame once per filter.
+        Indexing with the mask already returns a new frame, so callers never copy sales_data first.
+        Date ranges are narrowed beforehand with _date_slice.
+        """
+        mask = np.ones(len(df), dtype=bool)
         if branch and branch != "All Branches":
-            df = df[df['Branch'] == branch]
+            mask &= (df['Branch'] == branch).to_numpy()
+        if product and product != "All Products":
+            mask &= (df['Product'] == product).to_numpy()
+        # The calendar parts are plain small-int columns: compare their arrays directly, skipping
+        # the Series construction a pandas comparison would do
         if year:
-            df = df[df['Date'].dt.year == year]
+            mask &= df['Year'].to_numpy() == year
         if month:
-            df = df[df['Date'].dt.month == month]
+            mask &= df['Month'].to_numpy() == month
+        return mask
 
-        if df.empty:
-            return pd.DataFrame(columns=['Product', 'Quantity', 'UnitPrice', 'Total'])
-
-        # Aggregate by product, sum quantity and total, average unit price
-        return df.groupby('Product').agg(
-            Quantity=('Quantity', 'sum'),
-            UnitPrice=('UnitPrice', 'mean'), # Average unit price for summary
-            Total=('Total', 'sum')
-        ).reset_index()
+    @_cached_query
+    @_guard_empty(_EMPTY_MONTHLY)
+    def get_monthly_sales(self, branch=None, year=None, month=None):
+        """
+        Filters sales data by branch, year, and month, then aggregates total sales per product.
+        Returns a DataFrame with 'Product', 'Quantity', 'UnitPrice' (average) and 'Total' columns.
+        """
+        partials = self._monthly_totals()
+        partials = partials[self._filter_mask(partials, branch=branch, year=year, month=month)]
+
+        # Recombine the selected months and branches per product.
+        # observed=True keeps only products present after filtering and groups on category codes;
+        # the default sort only orders those codes, which keeps the report alphabetical.
+        report = partials.groupby('Product', observed=True)[list(self.MONTHLY_AGGREGATIONS)].sum()
+        unit_price = report['UnitPriceSum'] / report['Sales']
+        return pd.DataFrame({
+            'Product': report.index,
+            'Quantity': report['Quantity'].to_numpy(),
+            'UnitPrice': unit_price.to_numpy(), # Always a float: integer prices can average to a fraction
+            'Total': report['Total'].to_numpy(),
+        })
+
+    @_cached_query
+    def _monthly_totals(self):
+        """
+        Returns the sales pre-aggregated with MONTHLY_AGGREGATIONS, one row per Year, Month, Branch
+        and Product. Computed once per data change, so each monthly report only filters and sums
+        this small table instead of scanning every sale.
+        """
+        keys = ['Year', 'Month', 'Branch', 'Product']
+        return self.sales_data.groupby(keys, observed=True).agg(**self.MONTHLY_AGGREGATIONS).reset_index()
 
+    @_cached_query
+    @_guard_empty(_EMPTY_PRICE_HISTORY)
     def get_product_price_history(self, product_name):
         """
         Retrieves historical unit prices for a specific product.
-        Returns a DataFrame with 'Date' and 'UnitPrice' columns, sorted by date.
+        Returns a DataFrame with 'Date' and 'UnitPrice' columns (one price point per day), sorted by date.
         """
-        if self.sales_data.empty:
-            return pd.DataFrame(columns=['Date', 'UnitPrice'])
-        # Filter for the product, select relevant columns, drop duplicates for unique price points per day
-        # and sort by date to show trend.
-        return self.sales_data[self.sales_data['Product'] == product_name][['Date', 'UnitPrice']].drop_duplicates().sort_values(by='Date')
+        # Filter for the product and keep the last recorded price of each day; a single sorted
+        # groupby replaces drop_duplicates() (which hashes both columns) plus a separate sort.
+        product_prices = self.sales_data.loc[self.sales_data['Product'] == product_name, ['Date', 'UnitPrice']]
+        return product_prices.groupby('Date', as_index=False, sort=True)['UnitPrice'].last()
 
+    @_cached_query
+    @_guard_empty(pd.DataFrame({'DayOfWeek': DAYS_OF_WEEK, 'Total': [0] * 7})) # All days with 0 sales if no data
     def get_weekly_sales(self, start_date, end_date, branch=None):
         """
         Calculates daily sales totals for a specified week and branch.
         Returns a DataFrame with 'DayOfWeek' and 'Total' columns.
         """
-        if self.sales_data.empty:
-            # Return a DataFrame with all days of the week and 0 sales if no data
-            return pd.DataFrame({'DayOfWeek': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'], 'Total': [0]*7})
-
-        df = self.sales_data[(self.sales_data['Date'] >= start_date) & (self.sales_data['Date'] <= end_date)].copy()
-        if branch and branch != "All Branches":
-            df = df[df['Branch'] == branch]
+        # Work from the per-date, per-branch totals: a week spans a handful of dates however many
+        # transactions were recorded on them. The date index is sorted, so .loc slices it by binary search.
+        totals = self._totals_by_date_and_branch().loc[pd.Timestamp(start_date):pd.Timestamp(end_date)]
+        if not branch or branch == "All Branches":
+            totals = totals.sum(axis=1)
+        elif branch in totals.columns:
+            totals = totals[branch]
+        else:
+            totals = pd.Series(0.0, index=totals.index) # Unknown branch: no sales on any day
 
-        if df.empty:
-            # Return a DataFrame with all days of the week and 0 sales if no data
-            return pd.DataFrame({'DayOfWeek': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'], 'Total': [0]*7})
+        # Sum totals into one slot per integer day code (0=Monday); minlength=7 keeps days without
+        # sales at 0, and day names are only attached to the final 7-row result.
+        daily_totals = np.bincount(totals.index.dayofweek, weights=totals.to_numpy(np.float64), minlength=7)
+        return pd.DataFrame({'DayOfWeek': self.DAYS_OF_WEEK, 'Total': daily_totals})
 
-        df['DayOfWeek'] = df['Date'].dt.day_name()
-        # Group by day of week and reindex to ensure all days are present, even if no sales
-        return df.groupby('DayOfWeek')['Total'].sum().reindex(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'], fill_value=0).reset_index()
+    @_cached_query
+    def _totals_by_date_and_branch(self):
+        """
+        Returns total sales with one row per distinct 'Date' (sorted) and one column per branch,
+        computed once per data change and shared by all date-range queries over branch totals.
+        """
+        return self.sales_data.groupby(['Date', 'Branch'], observed=True)['Total'].sum().unstack(fill_value=0)
 
+    @_cached_query
+    @_guard_empty(_EMPTY_PREFERENCES)
     def get_product_preferences(self, date_range=None, category=None, branch=None):
         """
         Analyzes product popularity based on units sold and revenue within filters.
         Returns a DataFrame with 'Product', 'UnitsSold', and 'Revenue' columns.
         """
-        df = self.sales_data.copy()
-        if df.empty:
-            return pd.DataFrame(columns=['Product', 'UnitsSold', 'Revenue'])
-
+        df = self.sales_data
         if date_range:
-            start, end = date_range
-            df = df[(df['Date'] >= start) & (df['Date'] <= end)]
-        if branch and branch != "All Branches":
-            df = df[df['Branch'] == branch]
+            df = self._date_slice(*date_range)
+        df = df[self._filter_mask(df, branch=branch)]
         # Category filtering would require a 'Category' column in your data, which is not in dummy data
         # if category:
         #     df = df[df['Category'] == category]
 
-        if df.empty:
-            return pd.DataFrame(columns=['Product', 'UnitsSold', 'Revenue'])
-
-        return df.groupby('Product').agg(
-            UnitsSold=('Quantity', 'sum'),
-            Revenue=('Total', 'sum')
-        ).sort_values(by='UnitsSold', ascending=False).reset_index()
-
+        # Scatter-sum units and revenue into one slot per product category code; np.bincount does
+        # each sum in a single C loop without the generic groupby machinery.
+        codes = df['Product'].cat.codes.to_numpy()
+        categories = df['Product'].cat.categories
+        present = np.flatnonzero(np.bincount(codes, minlength=len(categories)))
+        units_sold = np.bincount(codes, weights=df['Quantity'].to_numpy(np.float64), minlength=len(categories))
+        revenue = np.bincount(codes, weights=df['Total'].to_numpy(np.float64), minlength=len(categories))
+        return pd.DataFrame({
+            'Product': pd.Categorical.from_codes(present, dtype=df['Product'].dtype),
+            'UnitsSold': units_sold[present].astype(np.result_type(df['Quantity'].dtype, np.int64)),
+            'Revenue': revenue[present].astype(np.result_type(df['Total'].dtype, np.int64))
+        }).sort_values(by='UnitsSold', ascending=False).reset_index(drop=True)
+
+    @_guard_empty(_EMPTY_DISTRIBUTION)
     def get_sales_distribution(self, date_range=None, branch=None, category=None):
         """
         Returns a Series of total sales amounts per transaction for distribution analysis.
         """
-        df = self.sales_data.copy()
-        if df.empty:
-            return pd.Series(dtype='float64') # Return empty Series if no data
-
+        df = self.sales_data
         if date_range:
-            start, end = date_range
-            df = df[(df['Date'] >= start) & (df['Date'] <= end)]
-        if branch and branch != "All Branches":
-            df = df[df['Branch'] == branch]
+            df = self._date_slice(*date_range)
+        df = df[self._filter_mask(df, branch=branch)]
         # Category filtering would require a 'Category' column in your data
         return df['Total'] # Assuming each row is a transaction or can be treated as such for distribution
 
+    @_cached_query
+    def get_sales_distribution_stats(self, date_range=None, branch=None, category=None):
+        """
+        Summarizes the sales amounts of get_sales_distribution for the same filters.
+        Returns a Series with 'mean', 'median', 'mode', 'min', 'max' and 'std' entries.
+        """
+        sales_amounts = self.get_sales_distribution(date_range, branch=branch, category=category)
+        # The summary statistics come from one batched agg() call
+        stats = sales_amounts.agg(['mean', 'median', 'min', 'max', 'std'])
+        # Mode can return multiple values, take the first if available. It needs a full hash pass over
+        # the amounts, which the cache above saves when the same filters are analyzed again.
+        modes = sales_amounts.mode()
+        stats['mode'] = modes.iloc[0] if not modes.empty else np.nan
+        return stats
+
+    def get_export_data(self, start_date, end_date, branch=None, product=None):
+        """
+        Returns the stored columns of the sales dated within [start_date, end_date] for the given
+        branch and product ("All Branches"/"All Products" or None for no filter), ready for export.
+        """
+        df = self._date_slice(start_date, end_date)
+        df = df[self._filter_mask(df, branch=branch, product=product)]
+        return df.drop(columns=self.DERIVED_COLUMNS, errors='ignore')
+
 
 # --- Base Page Class (Inheritance & Association) ---
 # O (Open/Closed Principle): New analysis pages can be added by inheriting from BasePage
@@ -197,6 +607,9 @@ class BasePage(tk.Toplevel):
     Base class for all analysis and utility pages.
     Handles common window properties and ensures return to dashboard.
     """
+    POLL_INTERVAL_MS = 20 # How often the Tk thread checks for a finished background task
+    TREE_BATCH_ROWS = 200 # Table rows inserted per batch by fill_treeview
+
     def __init__(self, master, data_manager, title="Application Page"):
         super().__init__(master)
         self.master = master # Association: BasePage has a reference to the MainApp (master)
@@ -213,8 +626,135 @@ class BasePage(tk.Toplevel):
         self.grid_rowconfigure(2, weight=1) # For table
         self.grid_columnconfigure(0, weight=1)
 
+        # Single worker thread for slow queries, so the window stays responsive while they run
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._task_id = 0 # Stamp of the latest background task; older results are discarded
+        self._menu_items = {} # Items currently listed in each dropdown, keyed by widget path
+        self._pending_tree_rows = iter(()) # Table rows not yet inserted into self.tree (see fill_treeview)
+        self.chart_row = None # Grid row of the page's chart, set by pages that draw one
+        self._fig = self._ax = self._canvas = None
+
+    @property
+    def fig(self):
+        """The page's matplotlib Figure, created on first use."""
+        self._ensure_chart()
+        return self._fig
+
+    @property
+    def ax(self):
+        """The Axes of the page's chart, created on first use."""
+        self._ensure_chart()
+        return self._ax
+
+    @property
+    def canvas(self):
+        """The Tk canvas showing the page's chart, created on first use."""
+        self._ensure_chart()
+        return self._canvas
+
+    def _ensure_chart(self):
+        """
+        Builds the chart (Figure, Axes and FigureCanvasTkAgg) in grid row self.chart_row.
+        Figure and Agg canvas setup is the slowest part of opening a page, so it is deferred until
+        the first report is drawn or exported instead of being paid before the window first appears.
+        """
+        if self._canvas is not None:
+            return
+        # matplotlib is the slowest import of the app and the login and dashboard windows never use it,
+        # so it is only imported once the first chart is built. Per-canvas figures are used; pyplot's
+        # global figure registry is not needed in a Tk app.
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        self._fig = Figure(figsize=(8, 4), layout='constrained') # Laid out again on every draw, so updates need no tight_layout() pass
+        self._ax = self._fig.add_subplot()
+        self._canvas = FigureCanvasTkAgg(self._fig, master=self)
+        self._canvas.get_tk_widget().grid(row=self.chart_row, column=0, sticky="nsew", padx=10, pady=10)
+
+    def create_dropdown(self, parent, var, items=("Loading...",)):
+        """
+        Creates a read-only Combobox bound to var, listing items and showing the first one.
+        Unlike an OptionMenu, its whole item list is set with one Tk call rather than one menu
+        entry (and Python callback) per item, which keeps refreshes cheap for long product lists.
+        """
+        dropdown = ttk.Combobox(parent, textvariable=var, values=list(items), state="readonly")
+        var.set(items[0])
+        return dropdown
+
+    def populate_dropdown(self, dropdown, var, items, empty_label):
+        """
+        Lists items in a dropdown and selects the first one (or shows empty_label if there are none).
+        Dropdowns refresh after every import, so the list is only replaced when its items actually
+        changed; otherwise the list and the user's current selection are left as they are.
+        """
+        if self._menu_items.get(str(dropdown)) == items:
+            return
+        dropdown['values'] = [str(item) for item in items]
+        self._menu_items[str(dropdown)] = items
+        var.set(str(items[0]) if items else empty_label)
+
+    def run_in_background(self, func, *args, on_done, on_error=None):
+        """
+        Runs func(*args) on the page's worker thread and passes its result to on_done on the Tk thread.
+        Tk is not thread-safe, so the worker never touches widgets: the Tk thread polls the future instead.
+        If another task is submitted before this one finishes, this one's result is dropped.
+        The page shows a busy cursor meanwhile. An exception raised by func is passed to on_error, also
+        on the Tk thread; without on_error it is reported in a generic message box.
+        """
+        self._task_id += 1
+        self.config(cursor="watch") # Busy until the result is shown
+        future = self._executor.submit(func, *args)
+        self._deliver_when_done(future, self._task_id, on_done, on_error)
+
+    def _deliver_when_done(self, future, task_id, on_done, on_error=None):
+        """Calls on_done with the future's result once it is ready, unless the task has been superseded."""
+        if task_id != self._task_id:
+            return
+        if not future.done():
+            self.after(self.POLL_INTERVAL_MS, self._deliver_when_done, future, task_id, on_done, on_error)
+            return
+        self.config(cursor="")
+        try:
+            result = future.result()
+        except Exception as e:
+            if on_error is not None:
+                on_error(e)
+            else:
+                messagebox.showerror("Error", f"An error occurred: {e}", parent=self)
+            return
+        on_done(result)
+
+    def fill_treeview(self, rows):
+        """
+        Replaces the contents of the page's Treeview (self.tree) with rows, an iterable of value tuples.
+        Only the first TREE_BATCH_ROWS rows are inserted now; each further batch is inserted when the
+        table is scrolled to the bottom, so long reports cost one Tcl insert per row actually reached.
+        """
+        self._clear_treeview()
+        self._pending_tree_rows = iter(rows)
+        self._insert_tree_batch()
+
+    def _insert_tree_batch(self):
+        """Inserts the next TREE_BATCH_ROWS pending rows at the end of the Treeview."""
+        for values in itertools.islice(self._pending_tree_rows, self.TREE_BATCH_ROWS):
+            self.tree.insert("", "end", values=values)
+
+    def _on_tree_yscroll(self, first, last):
+        """Treeview yscrollcommand: updates the scrollbar and loads more rows once the bottom is in view."""
+        self.tree_scroll.set(first, last)
+        if float(last) >= 1.0:
+            self.after_idle(self._insert_tree_batch)
+
+    def _clear_treeview(self):
+        """Clears all existing items from the Treeview, including rows not yet inserted."""
+        self._pending_tree_rows = iter(())
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children) # One Tcl call for all rows rather than one per row
+
     def on_close(self):
         """Handles closing the page, returning focus to the dashboard."""
+        self._task_id += 1 # Drop any pending background result; its widgets are about to be destroyed
+        self._executor.shutdown(wait=False)
         self.destroy() # Close this window
         self.master.deiconify() # Show the main dashboard again
         self.master.lift() # Bring main window to front
@@ -325,18 +865,18 @@ class DashboardPage(tk.Frame):
         if self.user_role == "admin":
             self.buttons_config.append(("Settings", self.open_settings))
 
-        # Create buttons
-        self.action_buttons = []
+        # Create buttons, keyed by label so state updates need no search over the widgets
+        self.action_buttons_by_text = {}
         for i, (text, command) in enumerate(self.buttons_config):
             btn = tk.Button(button_frame, text=text, command=command, width=25, height=2,
                       font=("Arial", 11), bg="#ADD8E6", fg="black", relief="ridge")
             btn.grid(row=i, column=0, pady=5)
-            self.action_buttons.append(btn)
+            self.action_buttons_by_text[text] = btn
 
 
         self.summary_label = tk.Label(self, text="", font=("Arial", 11), fg="blue")
         self.summary_label.grid(row=3, column=0, pady=15)
-        self.update_summary() # Optional: display summary
+        self.after_idle(self.update_summary) # Optional: display summary, computed after the dashboard is drawn
 
         tk.Button(self, text="Logout / Exit", command=self.logout_exit, font=("Arial", 12, "bold"), bg="#FF6347", fg="white", relief="raised").grid(row=4, column=0, pady=20)
 
@@ -346,22 +886,16 @@ class DashboardPage(tk.Frame):
         """Disables/enables analysis buttons based on data availability."""
         has_data = not self.data_manager.sales_data.empty
         for text, _ in self.buttons_config:
-            if text in ["Data Import", "Logout / Exit", "Settings"]: # These are always enabled
+            if text in ("Data Import", "Logout / Exit", "Settings"): # These are always enabled
                 continue
-            # Find the button and set its state
-            for btn in self.action_buttons:
-                if btn.cget("text") == text:
-                    btn.config(state=tk.NORMAL if has_data else tk.DISABLED)
-                    break
+            self.action_buttons_by_text[text].config(state=tk.NORMAL if has_data else tk.DISABLED)
 
     def update_summary(self):
         """Updates the dashboard summary with current data insights."""
         if not self.data_manager.sales_data.empty:
-            total_sales = self.data_manager.sales_data['Total'].sum()
             # Get top product by total sales for a more meaningful summary
-            top_product_df = self.data_manager.sales_data.groupby('Product')['Total'].sum().nlargest(1)
-            if not top_product_df.empty:
-                top_product_name = top_product_df.index[0]
+            total_sales, top_product_name = self.data_manager.get_sales_summary()
+            if top_product_name is not None:
                 summary_text = f"Total Sales (All Time): Rs. {total_sales:,.2f} | Top Product: {top_product_name}"
             else:
                 summary_text = "No sales data available for summary." # Should not happen if data is not empty
@@ -417,12 +951,12 @@ class MonthlySalesPage(BasePage):
 
         tk.Label(control_frame, text="Branch:").grid(row=0, column=0, padx=5)
         self.branch_var = tk.StringVar(self)
-        self.branch_dropdown = tk.OptionMenu(control_frame, self.branch_var, "Loading...")
+        self.branch_dropdown = self.create_dropdown(control_frame, self.branch_var)
         self.branch_dropdown.grid(row=0, column=1, padx=5)
 
         tk.Label(control_frame, text="Year:").grid(row=0, column=2, padx=5)
         self.year_var = tk.StringVar(self)
-        self.year_dropdown = tk.OptionMenu(control_frame, self.year_var, "Loading...")
+        self.year_dropdown = self.create_dropdown(control_frame, self.year_var)
         self.year_dropdown.grid(row=0, column=3, padx=5)
 
         tk.Label(control_frame, text="Month:").grid(row=0, column=4, padx=5)
@@ -431,7 +965,7 @@ class MonthlySalesPage(BasePage):
             "All Months", "January", "February", "March", "April", "May", "June",
             "July", "August", "September", "October", "November", "December"
         ]
-        self.month_dropdown = tk.OptionMenu(control_frame, self.month_var, *self.months)
+        self.month_dropdown = self.create_dropdown(control_frame, self.month_var, self.months)
         self.month_var.set("All Months")
         self.month_dropdown.grid(row=0, column=5, padx=5)
 
@@ -439,10 +973,9 @@ class MonthlySalesPage(BasePage):
         tk.Button(control_frame, text="Export Report (PDF)", command=self.export_report_pdf).grid(row=0, column=7, padx=10)
 
         # Chart Area
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
+        self.chart_row = 1 # Figure and canvas are built on first use (see BasePage.ax)
+        self.bars = None # Bar artists of the last report, reused while the product set is unchanged
+        self.bar_products = None
 
         # Table Area (using Treeview for better tabular display)
         self.tree_frame = tk.Frame(self)
@@ -463,39 +996,22 @@ class MonthlySalesPage(BasePage):
         self.tree.pack(side="left", fill="both", expand=True)
 
         self.tree_scroll = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=self.tree_scroll.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
         self.tree_scroll.pack(side="right", fill="y")
 
         self.last_report_df = pd.DataFrame() # To store data for export
-        self.refresh_dropdowns() # Initial population of dropdowns
+        self.after_idle(self.refresh_dropdowns) # Initial population of dropdowns, once the window has been drawn
 
     def refresh_dropdowns(self):
         """Populates or updates the branch and year dropdowns."""
         branches = ["All Branches"] + self.data_manager.get_branches()
         years = sorted(self.data_manager.get_years(), reverse=True) # Latest year first
 
-        # Update Branch Dropdown
-        self.branch_dropdown['menu'].delete(0, 'end')
-        for branch in branches:
-            self.branch_dropdown['menu'].add_command(label=branch, command=tk._setit(self.branch_var, branch))
-        if branches:
-            self.branch_var.set(branches[0])
-        else:
-            self.branch_var.set("No Branches Available")
-            self.branch_dropdown.config(state=tk.DISABLED)
-
-        # Update Year Dropdown
-        self.year_dropdown['menu'].delete(0, 'end')
-        for year in years:
-            self.year_dropdown['menu'].add_command(label=str(year), command=tk._setit(self.year_var, str(year)))
-        if years:
-            self.year_var.set(str(years[0]))
-        else:
-            self.year_var.set(str(datetime.now().year)) # Default to current year
-            self.year_dropdown.config(state=tk.DISABLED)
+        self.populate_dropdown(self.branch_dropdown, self.branch_var, branches, "No Branches Available")
+        self.populate_dropdown(self.year_dropdown, self.year_var, years, str(datetime.now().year)) # Default to current year
 
         # Enable dropdowns if data exists, otherwise disable
-        state = tk.NORMAL if not self.data_manager.sales_data.empty else tk.DISABLED
+        state = "readonly" if not self.data_manager.sales_data.empty else tk.DISABLED
         self.branch_dropdown.config(state=state)
         self.year_dropdown.config(state=state)
         self.month_dropdown.config(state=state)
@@ -506,7 +1022,8 @@ class MonthlySalesPage(BasePage):
         if self.data_manager.sales_data.empty:
             messagebox.showinfo("No Data", "Please import sales data first to generate reports.", parent=self)
             self.ax.clear()
-            self.canvas.draw()
+            self.bars = self.bar_products = None
+            self.canvas.draw_idle()
             self._clear_treeview()
             return
 
@@ -519,40 +1036,50 @@ class MonthlySalesPage(BasePage):
         if selected_month_name != "All Months":
             selected_month = datetime.strptime(selected_month_name, "%B").month
 
-        report_data = self.data_manager.get_monthly_sales(selected_branch, selected_year, selected_month)
+        # Filter and aggregate on the worker thread; the table and chart are updated on the Tk thread
+        self.run_in_background(
+            self.data_manager.get_monthly_sales, selected_branch, selected_year, selected_month,
+            on_done=lambda report_data: self._apply_report(report_data, selected_month_name, selected_year_str)
+        )
+
+    def _apply_report(self, report_data, selected_month_name, selected_year_str):
+        """Shows a monthly sales report in the table and chart."""
         self.last_report_df = report_data # Store for export
 
         if report_data.empty:
             messagebox.showinfo("No Data", "No sales data found for the selected criteria.", parent=self)
             self.ax.clear()
-            self.canvas.draw()
+            self.bars = self.bar_products = None
+            self.canvas.draw_idle()
             self._clear_treeview()
             return
 
-        # Update Table (Treeview)
-        self._clear_treeview()
-        for index, row in report_data.iterrows():
-            self.tree.insert("", "end", values=(
-                row['Product'],
-                f"{row['Quantity']:.0f}",
-                f"Rs. {row['UnitPrice']:.2f}",
-                f"Rs. {row['Total']:.2f}"
-            ))
-
-        # Update Chart
-        self.ax.clear()
-        self.ax.bar(report_data['Product'], report_data['Total'], color='skyblue')
+        # Update Table (Treeview): format whole columns up front and insert plain tuples,
+        # instead of boxing every row into a Series with iterrows()
+        self.fill_treeview(zip(
+            report_data['Product'].to_numpy(),
+            report_data['Quantity'].map('{:.0f}'.format).to_numpy(),
+            report_data['UnitPrice'].map('Rs. {:.2f}'.format).to_numpy(),
+            report_data['Total'].map('Rs. {:.2f}'.format).to_numpy()
+        ))
+
+        # Update Chart: for the same set of products only the bar heights change, so reuse the
+        # existing bars instead of clearing and rebuilding every artist on the axes.
+        products = report_data['Product'].astype(str).tolist()
+        if self.bars is not None and products == self.bar_products:
+            for bar, height in zip(self.bars, report_data['Total'].to_numpy()):
+                bar.set_height(height)
+            self.ax.relim()
+            self.ax.autoscale_view()
+        else:
+            self.ax.clear()
+            self.bars = self.ax.bar(products, report_data['Total'], color='skyblue')
+            self.bar_products = products
+            self.ax.set_xlabel('Product')
+            self.ax.set_ylabel('Total Sales (Rs.)')
+            self.fig.autofmt_xdate(rotation=45)
         self.ax.set_title(f'Total Sales per Product ({selected_month_name} {selected_year_str})')
-        self.ax.set_xlabel('Product')
-        self.ax.set_ylabel('Total Sales (Rs.)')
-        self.fig.autofmt_xdate(rotation=45)
-        plt.tight_layout()
-        self.canvas.draw()
-
-    def _clear_treeview(self):
-        """Clears all existing items from the Treeview."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.canvas.draw_idle()
 
     def export_report_pdf(self):
         """Exports the current report as a PDF."""
@@ -587,16 +1114,14 @@ class PriceAnalysisPage(BasePage):
 
         tk.Label(control_frame, text="Select Product:").grid(row=0, column=0, padx=5)
         self.product_var = tk.StringVar(self)
-        self.product_dropdown = tk.OptionMenu(control_frame, self.product_var, "Loading...")
+        self.product_dropdown = self.create_dropdown(control_frame, self.product_var)
         self.product_dropdown.grid(row=0, column=1, padx=5)
 
         tk.Button(control_frame, text="Analyze Price", command=self.analyze_price).grid(row=0, column=2, padx=10)
 
         # Chart Area
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
+        self.chart_row = 1 # Figure and canvas are built on first use (see BasePage.ax)
+        self.line = None # Price line of the last analysis, updated in place for the next product
 
         # Stats Labels
         self.stats_frame = tk.Frame(self)
@@ -624,29 +1149,23 @@ class PriceAnalysisPage(BasePage):
         self.tree.pack(side="left", fill="both", expand=True)
 
         self.tree_scroll = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=self.tree_scroll.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
         self.tree_scroll.pack(side="right", fill="y")
-        self.refresh_dropdowns() # Initial population of dropdowns
+        self.after_idle(self.refresh_dropdowns) # Initial population of dropdowns, once the window has been drawn
 
     def refresh_dropdowns(self):
         """Populates or updates the product dropdown."""
         products = self.data_manager.get_products()
-        self.product_dropdown['menu'].delete(0, 'end')
-        if products:
-            for product in products:
-                self.product_dropdown['menu'].add_command(label=product, command=tk._setit(self.product_var, product))
-            self.product_var.set(products[0]) # Set default if products exist
-            self.product_dropdown.config(state=tk.NORMAL)
-        else:
-            self.product_var.set("No Products Available")
-            self.product_dropdown.config(state=tk.DISABLED)
+        self.populate_dropdown(self.product_dropdown, self.product_var, products, "No Products Available")
+        self.product_dropdown.config(state="readonly" if products else tk.DISABLED)
 
     def analyze_price(self):
         """Fetches and displays price history for the selected product."""
         if self.data_manager.sales_data.empty:
             messagebox.showinfo("No Data", "Please import sales data first to analyze prices.", parent=self)
             self.ax.clear()
-            self.canvas.draw()
+            self.line = None
+            self.canvas.draw_idle()
             self.update_stats(None, None, None, None)
             self._clear_treeview()
             return
@@ -656,25 +1175,36 @@ class PriceAnalysisPage(BasePage):
             messagebox.showwarning("Selection Error", "Please select a product.", parent=self)
             return
 
-        price_history_df = self.data_manager.get_product_price_history(selected_product)
+        # Look up the history on the worker thread; the chart, stats and table are updated on the Tk thread
+        self.run_in_background(
+            self.data_manager.get_product_price_history, selected_product,
+            on_done=lambda price_history_df: self._apply_price_history(price_history_df, selected_product)
+        )
 
+    def _apply_price_history(self, price_history_df, selected_product):
+        """Shows a product's price history in the chart, stats labels and table."""
         if price_history_df.empty:
             messagebox.showinfo("No Data", f"No price history found for {selected_product}.", parent=self)
             self.ax.clear()
-            self.canvas.draw()
+            self.line = None
+            self.canvas.draw_idle()
             self.update_stats(None, None, None, None)
             self._clear_treeview()
             return
 
-        # Update Chart
-        self.ax.clear()
-        self.ax.plot(price_history_df['Date'], price_history_df['UnitPrice'], marker='o', linestyle='-')
+        # Update Chart: move the existing line to the new points instead of rebuilding the axes
+        if self.line is not None:
+            self.line.set_data(price_history_df['Date'], price_history_df['UnitPrice'])
+            self.ax.relim()
+            self.ax.autoscale_view()
+        else:
+            self.ax.clear()
+            self.line, = self.ax.plot(price_history_df['Date'], price_history_df['UnitPrice'], marker='o', linestyle='-')
+            self.ax.set_xlabel('Date')
+            self.ax.set_ylabel('Unit Price (Rs.)')
         self.ax.set_title(f'Price Fluctuation for {selected_product}')
-        self.ax.set_xlabel('Date')
-        self.ax.set_ylabel('Unit Price (Rs.)')
         self.fig.autofmt_xdate()
-        plt.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
         # Update Stats
         avg_price = price_history_df['UnitPrice'].mean()
@@ -683,10 +1213,11 @@ class PriceAnalysisPage(BasePage):
         current_price = price_history_df.iloc[-1]['UnitPrice'] # Last recorded price
         self.update_stats(avg_price, max_price, min_price, current_price)
 
-        # Update Table
-        self._clear_treeview()
-        for index, row in price_history_df.iterrows():
-            self.tree.insert("", "end", values=(row['Date'].strftime('%Y-%m-%d'), f"Rs. {row['UnitPrice']:.2f}"))
+        # Update Table: format whole columns up front and insert plain tuples (see MonthlySalesPage)
+        self.fill_treeview(zip(
+            price_history_df['Date'].dt.strftime('%Y-%m-%d').to_numpy(),
+            price_history_df['UnitPrice'].map('Rs. {:.2f}'.format).to_numpy()
+        ))
 
     def update_stats(self, avg, max_val, min_val, current):
         """Updates the statistical labels for price analysis."""
@@ -695,11 +1226,6 @@ class PriceAnalysisPage(BasePage):
         self.min_price_label.config(text=f"Min Price: Rs. {min_val:.2f}" if min_val is not None else "Min Price: N/A")
         self.current_price_label.config(text=f"Current Price: Rs. {current:.2f}" if current is not None else "Current Price: N/A")
 
-    def _clear_treeview(self):
-        """Clears all existing items from the Treeview."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
 # --- 5. Weekly Sales Summary Page ---
 class WeeklySalesPage(BasePage):
     """
@@ -724,17 +1250,14 @@ class WeeklySalesPage(BasePage):
 
         tk.Label(control_frame, text="Branch:").grid(row=0, column=4, padx=5)
         self.branch_var = tk.StringVar(self)
-        self.branch_dropdown = tk.OptionMenu(control_frame, self.branch_var, "Loading...")
+        self.branch_dropdown = self.create_dropdown(control_frame, self.branch_var)
         self.branch_dropdown.grid(row=0, column=5, padx=5)
 
         tk.Button(control_frame, text="Generate Summary", command=self.generate_summary).grid(row=1, column=0, columnspan=6, pady=10)
 
         # Chart Area
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
-        self.canvas_widget.grid(row=1, column=0, sticky="nsew", padx=10, pady=10) # Re-grid after button row
+        self.chart_row = 1 # Figure and canvas are built on first use (see BasePage.ax)
+        self.bars = None # One bar per weekday, reused for every later summary
 
         # Summary Labels
         self.summary_frame = tk.Frame(self)
@@ -758,23 +1281,16 @@ class WeeklySalesPage(BasePage):
         self.tree.pack(side="left", fill="both", expand=True)
 
         self.tree_scroll = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=self.tree_scroll.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
         self.tree_scroll.pack(side="right", fill="y")
-        self.refresh_dropdowns() # Initial population of dropdowns
+        self.after_idle(self.refresh_dropdowns) # Initial population of dropdowns, once the window has been drawn
 
     def refresh_dropdowns(self):
         """Populates or updates the branch dropdown."""
         branches = ["All Branches"] + self.data_manager.get_branches()
-        self.branch_dropdown['menu'].delete(0, 'end')
-        for branch in branches:
-            self.branch_dropdown['menu'].add_command(label=branch, command=tk._setit(self.branch_var, branch))
-        if branches:
-            self.branch_var.set(branches[0])
-        else:
-            self.branch_var.set("No Branches Available")
-            self.branch_dropdown.config(state=tk.DISABLED)
+        self.populate_dropdown(self.branch_dropdown, self.branch_var, branches, "No Branches Available")
 
-        state = tk.NORMAL if not self.data_manager.sales_data.empty else tk.DISABLED
+        state = "readonly" if not self.data_manager.sales_data.empty else tk.DISABLED
         self.branch_dropdown.config(state=state)
 
     def generate_summary(self):
@@ -782,7 +1298,8 @@ class WeeklySalesPage(BasePage):
         if self.data_manager.sales_data.empty:
             messagebox.showinfo("No Data", "Please import sales data first to generate weekly summaries.", parent=self)
             self.ax.clear()
-            self.canvas.draw()
+            self.bars = None
+            self.canvas.draw_idle()
             self.update_summary_labels(None, None)
             self._clear_treeview()
             return
@@ -798,51 +1315,58 @@ class WeeklySalesPage(BasePage):
 
             selected_branch = self.branch_var.get()
 
-            weekly_sales_df = self.data_manager.get_weekly_sales(start_date, end_date, selected_branch)
+            # Aggregate on the worker thread; the chart, labels and table are updated on the Tk thread
+            self.run_in_background(
+                self.data_manager.get_weekly_sales, start_date, end_date, selected_branch,
+                on_done=lambda weekly_sales_df: self._apply_summary(weekly_sales_df, start_date_str, end_date_str)
+            )
+        except ValueError:
+            messagebox.showerror("Input Error", "Invalid date format. Please use YYYY-MM-%d.", parent=self)
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred: {e}", parent=self)
 
-            if weekly_sales_df.empty or weekly_sales_df['Total'].sum() == 0:
-                messagebox.showinfo("No Data", "No sales data found for the selected week and branch.", parent=self)
-                self.ax.clear()
-                self.canvas.draw()
-                self.update_summary_labels(None, None)
-                self._clear_treeview()
-                return
+    def _apply_summary(self, weekly_sales_df, start_date_str, end_date_str):
+        """Shows a weekly sales summary in the chart, summary labels and table."""
+        if weekly_sales_df.empty or weekly_sales_df['Total'].sum() == 0:
+            messagebox.showinfo("No Data", "No sales data found for the selected week and branch.", parent=self)
+            self.ax.clear()
+            self.bars = None
+            self.canvas.draw_idle()
+            self.update_summary_labels(None, None)
+            self._clear_treeview()
+            return
 
-            # Update Chart
+        # Update Chart: the seven weekday bars stay in place; only their heights change
+        if self.bars is not None:
+            for bar, height in zip(self.bars, weekly_sales_df['Total'].to_numpy()):
+                bar.set_height(height)
+            self.ax.relim()
+            self.ax.autoscale_view()
+        else:
             self.ax.clear()
-            self.ax.bar(weekly_sales_df['DayOfWeek'], weekly_sales_df['Total'], color='lightgreen')
-            self.ax.set_title(f'Weekly Sales Summary ({start_date_str} to {end_date_str})')
+            self.bars = self.ax.bar(weekly_sales_df['DayOfWeek'], weekly_sales_df['Total'], color='lightgreen')
             self.ax.set_xlabel('Day of Week')
             self.ax.set_ylabel('Total Sales (Rs.)')
-            plt.tight_layout()
-            self.canvas.draw()
-
-            # Update Summary
-            total_revenue = weekly_sales_df['Total'].sum()
-            num_days_with_sales = (weekly_sales_df['Total'] > 0).sum()
-            avg_daily_sales = total_revenue / num_days_with_sales if num_days_with_sales > 0 else 0
-            self.update_summary_labels(total_revenue, avg_daily_sales)
+        self.ax.set_title(f'Weekly Sales Summary ({start_date_str} to {end_date_str})')
+        self.canvas.draw_idle()
 
-            # Update Table
-            self._clear_treeview()
-            for index, row in weekly_sales_df.iterrows():
-                self.tree.insert("", "end", values=(row['DayOfWeek'], f"Rs. {row['Total']:.2f}"))
+        # Update Summary
+        total_revenue = weekly_sales_df['Total'].sum()
+        num_days_with_sales = (weekly_sales_df['Total'] > 0).sum()
+        avg_daily_sales = total_revenue / num_days_with_sales if num_days_with_sales > 0 else 0
+        self.update_summary_labels(total_revenue, avg_daily_sales)
 
-        except ValueError:
-            messagebox.showerror("Input Error", "Invalid date format. Please use YYYY-MM-%d.", parent=self)
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {e}", parent=self)
+        # Update Table
+        self.fill_treeview(zip(
+            weekly_sales_df['DayOfWeek'].to_numpy(),
+            weekly_sales_df['Total'].map('Rs. {:.2f}'.format).to_numpy()
+        ))
 
     def update_summary_labels(self, total_revenue, avg_daily_sales):
         """Updates the summary labels for weekly sales."""
         self.total_revenue_label.config(text=f"Total Revenue: Rs. {total_revenue:,.2f}" if total_revenue is not None else "Total Revenue: N/A")
         self.avg_daily_sales_label.config(text=f"Average Daily Sales: Rs. {avg_daily_sales:,.2f}" if avg_daily_sales is not None else "Average Daily Sales: N/A")
 
-    def _clear_treeview(self):
-        """Clears all existing items from the Treeview."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
 # --- 6. Product Preference Analysis Page ---
 class ProductPreferencePage(BasePage):
     """
@@ -867,17 +1391,14 @@ class ProductPreferencePage(BasePage):
 
         tk.Label(control_frame, text="Branch:").grid(row=0, column=4, padx=5)
         self.branch_var = tk.StringVar(self)
-        self.branch_dropdown = tk.OptionMenu(control_frame, self.branch_var, "Loading...")
+        self.branch_dropdown = self.create_dropdown(control_frame, self.branch_var)
         self.branch_dropdown.grid(row=0, column=5, padx=5)
 
         tk.Button(control_frame, text="Analyze Preferences", command=self.analyze_preferences).grid(row=1, column=0, columnspan=3, pady=10)
         tk.Button(control_frame, text="Export Report", command=self.export_report).grid(row=1, column=3, columnspan=3, pady=10)
 
         # Chart Area
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.grid(row=2, column=0, sticky="nsew", padx=10, pady=10)
+        self.chart_row = 2 # Figure and canvas are built on first use (see BasePage.ax)
 
         # Table Area (Treeview)
         self.tree_frame = tk.Frame(self)
@@ -893,25 +1414,18 @@ class ProductPreferencePage(BasePage):
         self.tree.pack(side="left", fill="both", expand=True)
 
         self.tree_scroll = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=self.tree_scroll.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
         self.tree_scroll.pack(side="right", fill="y")
 
         self.last_report_data = None # To hold data for export
-        self.refresh_dropdowns() # Initial population of dropdowns
+        self.after_idle(self.refresh_dropdowns) # Initial population of dropdowns, once the window has been drawn
 
     def refresh_dropdowns(self):
         """Populates or updates the branch dropdown."""
         branches = ["All Branches"] + self.data_manager.get_branches()
-        self.branch_dropdown['menu'].delete(0, 'end')
-        for branch in branches:
-            self.branch_dropdown['menu'].add_command(label=branch, command=tk._setit(self.branch_var, branch))
-        if branches:
-            self.branch_var.set(branches[0])
-        else:
-            self.branch_var.set("No Branches Available")
-            self.branch_dropdown.config(state=tk.DISABLED)
+        self.populate_dropdown(self.branch_dropdown, self.branch_var, branches, "No Branches Available")
 
-        state = tk.NORMAL if not self.data_manager.sales_data.empty else tk.DISABLED
+        state = "readonly" if not self.data_manager.sales_data.empty else tk.DISABLED
         self.branch_dropdown.config(state=state)
 
     def analyze_preferences(self):
@@ -919,7 +1433,7 @@ class ProductPreferencePage(BasePage):
         if self.data_manager.sales_data.empty:
             messagebox.showinfo("No Data", "Please import sales data first to analyze product preferences.", parent=self)
             self.ax.clear()
-            self.canvas.draw()
+            self.canvas.draw_idle()
             self._clear_treeview()
             self.last_report_data = None
             return
@@ -936,48 +1450,48 @@ class ProductPreferencePage(BasePage):
             selected_branch = self.branch_var.get()
             date_range = (start_date, end_date)
 
-            preference_df = self.data_manager.get_product_preferences(date_range, branch=selected_branch)
-
-            if preference_df.empty:
-                messagebox.showinfo("No Data", "No product preference data found for the selected criteria.", parent=self)
-                self.ax.clear()
-                self.canvas.draw()
-                self._clear_treeview()
-                self.last_report_data = None
-                return
-
-            self.last_report_data = preference_df.copy()
-
-            # Update Table
-            self._clear_treeview()
-            for index, row in preference_df.iterrows():
-                self.tree.insert("", "end", values=(
-                    row['Product'],
-                    f"{row['UnitsSold']:.0f}",
-                    f"Rs. {row['Revenue']:.2f}"
-                ))
-
-            # Update Chart (Top 10 Products by Units Sold)
-            top_10 = preference_df.head(10)
-            self.ax.clear()
-            if not top_10.empty:
-                self.ax.pie(top_10['UnitsSold'], labels=top_10['Product'], autopct='%1.1f%%', startangle=90, pctdistance=0.85)
-                self.ax.set_title('Top 10 Product Preferences by Units Sold')
-                self.ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
-            else:
-                self.ax.text(0.5, 0.5, "No data for chart", horizontalalignment='center', verticalalignment='center', transform=self.ax.transAxes)
-            plt.tight_layout()
-            self.canvas.draw()
-
+            # Aggregate on the worker thread; the table and chart are updated on the Tk thread
+            self.run_in_background(
+                functools.partial(self.data_manager.get_product_preferences, date_range, branch=selected_branch),
+                on_done=self._apply_preferences
+            )
         except ValueError:
             messagebox.showerror("Input Error", "Invalid date format. Please use YYYY-MM-%d.", parent=self)
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {e}", parent=self)
 
-    def _clear_treeview(self):
-        """Clears all existing items from the Treeview."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def _apply_preferences(self, preference_df):
+        """Shows a product preference report in the table and chart."""
+        if preference_df.empty:
+            messagebox.showinfo("No Data", "No product preference data found for the selected criteria.", parent=self)
+            self.ax.clear()
+            self.canvas.draw_idle()
+            self._clear_treeview()
+            self.last_report_data = None
+            return
+
+        self.last_report_data = preference_df.copy()
+
+        # Update Table
+        # Format whole columns up front and insert plain tuples (see MonthlySalesPage)
+        self.fill_treeview(zip(
+            preference_df['Product'].to_numpy(),
+            preference_df['UnitsSold'].map('{:.0f}'.format).to_numpy(),
+            preference_df['Revenue'].map('Rs. {:.2f}'.format).to_numpy()
+        ))
+
+        # Update Chart (Top 10 Products by Units Sold)
+        top_10 = preference_df.head(10)
+        self.ax.clear()
+        if not top_10.empty:
+            # Horizontal bars, best seller on top: one patch per product, and no per-wedge label
+            # and percentage text to lay out as with a pie
+            self.ax.barh(top_10['Product'].astype(str).to_numpy()[::-1], top_10['UnitsSold'].to_numpy()[::-1], color='mediumpurple')
+            self.ax.set_title('Top 10 Product Preferences by Units Sold')
+            self.ax.set_xlabel('Units Sold')
+        else:
+            self.ax.text(0.5, 0.5, "No data for chart", horizontalalignment='center', verticalalignment='center', transform=self.ax.transAxes)
+        self.canvas.draw_idle()
 
     def export_report(self):
         """Exports the product preference report to CSV/Excel."""
@@ -993,9 +1507,9 @@ class ProductPreferencePage(BasePage):
         if file_path:
             try:
                 if file_path.endswith(".csv"):
-                    self.last_report_data.to_csv(file_path, index=False)
+                    _write_csv(self.last_report_data, file_path)
                 elif file_path.endswith(".xlsx"):
-                    self.last_report_data.to_excel(file_path, index=False)
+                    _write_excel(self.last_report_data, file_path)
                 messagebox.showinfo("Export Success", f"Report saved to {file_path}", parent=self)
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export report: {e}", parent=self)
@@ -1005,6 +1519,8 @@ class SalesDistributionPage(BasePage):
     """
     Visualizes how total sales amounts are distributed across transactions using a histogram.
     """
+    HISTOGRAM_BINS = 30
+
     def __init__(self, master, data_manager):
         super().__init__(master, data_manager, "Sales Distribution Analysis")
 
@@ -1024,16 +1540,14 @@ class SalesDistributionPage(BasePage):
 
         tk.Label(control_frame, text="Branch:").grid(row=0, column=4, padx=5)
         self.branch_var = tk.StringVar(self)
-        self.branch_dropdown = tk.OptionMenu(control_frame, self.branch_var, "Loading...")
+        self.branch_dropdown = self.create_dropdown(control_frame, self.branch_var)
         self.branch_dropdown.grid(row=0, column=5, padx=5)
 
         tk.Button(control_frame, text="Analyze Distribution", command=self.analyze_distribution).grid(row=1, column=0, columnspan=6, pady=10)
 
         # Chart Area
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.grid(row=2, column=0, sticky="nsew", padx=10, pady=10)
+        self.chart_row = 2 # Figure and canvas are built on first use (see BasePage.ax)
+        self.hist_bars = None # Histogram bars of the last analysis, moved onto the next one's bins
 
         # Stats Labels
         self.stats_frame = tk.Frame(self)
@@ -1052,22 +1566,15 @@ class SalesDistributionPage(BasePage):
         self.max_label.grid(row=0, column=4, padx=5)
         self.std_dev_label = tk.Label(self.stats_frame, text="Std Dev: N/A")
         self.std_dev_label.grid(row=0, column=5, padx=5)
-        self.refresh_dropdowns() # Initial population of dropdowns
+        self.after_idle(self.refresh_dropdowns) # Initial population of dropdowns, once the window has been drawn
 
 
     def refresh_dropdowns(self):
         """Populates or updates the branch dropdown."""
         branches = ["All Branches"] + self.data_manager.get_branches()
-        self.branch_dropdown['menu'].delete(0, 'end')
-        for branch in branches:
-            self.branch_dropdown['menu'].add_command(label=branch, command=tk._setit(self.branch_var, branch))
-        if branches:
-            self.branch_var.set(branches[0])
-        else:
-            self.branch_var.set("No Branches Available")
-            self.branch_dropdown.config(state=tk.DISABLED)
+        self.populate_dropdown(self.branch_dropdown, self.branch_var, branches, "No Branches Available")
 
-        state = tk.NORMAL if not self.data_manager.sales_data.empty else tk.DISABLED
+        state = "readonly" if not self.data_manager.sales_data.empty else tk.DISABLED
         self.branch_dropdown.config(state=state)
 
     def analyze_distribution(self):
@@ -1075,7 +1582,8 @@ class SalesDistributionPage(BasePage):
         if self.data_manager.sales_data.empty:
             messagebox.showinfo("No Data", "Please import sales data first to analyze sales distribution.", parent=self)
             self.ax.clear()
-            self.canvas.draw()
+            self.hist_bars = None
+            self.canvas.draw_idle()
             self.update_stats(None, None, None, None, None, None)
             return
 
@@ -1091,38 +1599,47 @@ class SalesDistributionPage(BasePage):
             selected_branch = self.branch_var.get()
             date_range = (start_date, end_date)
 
-            sales_amounts = self.data_manager.get_sales_distribution(date_range, branch=selected_branch)
+            def query():
+                return (self.data_manager.get_sales_distribution(date_range, branch=selected_branch),
+                        self.data_manager.get_sales_distribution_stats(date_range, branch=selected_branch))
 
-            if sales_amounts.empty:
-                messagebox.showinfo("No Data", "No sales distribution data found for the selected criteria.", parent=self)
-                self.ax.clear()
-                self.canvas.draw()
-                self.update_stats(None, None, None, None, None, None)
-                return
+            # Filter and summarize on the worker thread; the chart and stats are updated on the Tk thread
+            self.run_in_background(query, on_done=lambda result: self._apply_distribution(*result))
+        except ValueError:
+            messagebox.showerror("Input Error", "Invalid date format. Please use YYYY-MM-%d.", parent=self)
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred: {e}", parent=self)
 
-            # Update Chart (Histogram)
+    def _apply_distribution(self, sales_amounts, stats):
+        """Shows the distribution of sales amounts in the histogram and stats labels."""
+        if sales_amounts.empty:
+            messagebox.showinfo("No Data", "No sales distribution data found for the selected criteria.", parent=self)
             self.ax.clear()
-            self.ax.hist(sales_amounts, bins=30, edgecolor='black', alpha=0.7)
+            self.hist_bars = None
+            self.canvas.draw_idle()
+            self.update_stats(None, None, None, None, None, None)
+            return
+
+        # Update Chart (Histogram): bin with np.histogram, then reshape the existing bars to the
+        # new bins rather than letting ax.hist() re-bin the data and rebuild every patch
+        counts, edges = np.histogram(sales_amounts.to_numpy(), bins=self.HISTOGRAM_BINS)
+        if self.hist_bars is not None:
+            for bar, left, width, count in zip(self.hist_bars, edges[:-1], np.diff(edges), counts):
+                bar.set_x(left)
+                bar.set_width(width)
+                bar.set_height(count)
+            self.ax.relim()
+            self.ax.autoscale_view()
+        else:
+            self.ax.clear()
+            self.hist_bars = self.ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', edgecolor='black', alpha=0.7)
             self.ax.set_title('Sales Amount Distribution')
             self.ax.set_xlabel('Sales Amount (Rs.)')
             self.ax.set_ylabel('Frequency')
-            plt.tight_layout()
-            self.canvas.draw()
-
-            # Update Stats
-            mean_val = sales_amounts.mean()
-            median_val = sales_amounts.median()
-            # Mode can return multiple values, take the first if available
-            mode_val = sales_amounts.mode()[0] if not sales_amounts.mode().empty else np.nan
-            min_val = sales_amounts.min()
-            max_val = sales_amounts.max()
-            std_dev_val = sales_amounts.std()
-            self.update_stats(mean_val, median_val, mode_val, min_val, max_val, std_dev_val)
+        self.canvas.draw_idle()
 
-        except ValueError:
-            messagebox.showerror("Input Error", "Invalid date format. Please use YYYY-MM-%d.", parent=self)
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {e}", parent=self)
+        # Update Stats
+        self.update_stats(stats['mean'], stats['median'], stats['mode'], stats['min'], stats['max'], stats['std'])
 
     def update_stats(self, mean, median, mode, min_val, max_val, std_dev):
         """Updates the statistical labels for sales distribution."""
@@ -1140,6 +1657,8 @@ class DataImportPage(BasePage):
     """
     Allows users to import new sales data from CSV/Excel files.
     """
+    PREVIEW_ROWS = 5 # Only this many rows are read to preview a file; the full file is read on save
+
     def __init__(self, master, data_manager):
         super().__init__(master, data_manager, "Data Import")
 
@@ -1179,6 +1698,20 @@ class DataImportPage(BasePage):
         else:
             self.file_label.config(text="No file selected")
 
+    def _read_file(self, nrows=None):
+        """
+        Reads the selected CSV/Excel file, or only its first nrows rows if given.
+        Returns None for unsupported file types.
+        """
+        if self.file_path.endswith(".csv"):
+            # Key columns are parsed straight into categoricals, the dtype DataManager stores them in,
+            # so a large import never holds one Python string per row for them
+            return pd.read_csv(self.file_path, nrows=nrows,
+                               dtype={col: 'category' for col in DataManager.CATEGORY_COLUMNS})
+        elif self.file_path.endswith(".xlsx"):
+            return pd.read_excel(self.file_path, nrows=nrows)
+        return None
+
     def preview_data(self):
         """Reads and displays a preview of the selected data file."""
         if not self.file_path:
@@ -1186,20 +1719,18 @@ class DataImportPage(BasePage):
             return
 
         try:
-            if self.file_path.endswith(".csv"):
-                df = pd.read_csv(self.file_path)
-            elif self.file_path.endswith(".xlsx"):
-                df = pd.read_excel(self.file_path)
-            else:
+            df = self._read_file(nrows=self.PREVIEW_ROWS)
+            if df is None:
                 messagebox.showerror("Invalid File", "Unsupported file type. Please select CSV or Excel.", parent=self)
                 return
 
-            self.preview_df = df # Store for saving
+            self.preview_df = df # Marks the file as previewed; save_data reads it in full
 
             self.preview_text.delete(1.0, tk.END)
-            self.preview_text.insert(tk.END, "Preview of the first 5 rows:\n\n")
+            self.preview_text.insert(tk.END, f"Preview of the first {self.PREVIEW_ROWS} rows:\n\n")
             self.preview_text.insert(tk.END, df.head().to_string())
-            self.preview_text.insert(tk.END, f"\n\nTotal records in preview: {len(df)}")
+            # Only the preview rows are parsed here; save_data reports the file's record count once read in full
+            self.preview_text.insert(tk.END, f"\n\nShowing the first {len(df)} rows. The total record count is shown after saving.")
 
             # Check for required columns and enable save button if all are present
             required_cols = ['Date', 'Branch', 'Product', 'Quantity', 'UnitPrice', 'Total']
@@ -1224,14 +1755,19 @@ class DataImportPage(BasePage):
             messagebox.showwarning("No Data", "No data to save. Please preview a file first.", parent=self)
             return
 
-        if self.data_manager.add_data(self.preview_df):
-            self.status_label.config(text=f"{len(self.preview_df)} records successfully uploaded and saved!", fg="green")
+        try:
+            df = self._read_file()
+        except Exception as e:
+            messagebox.showerror("Import Error", f"Error reading file: {e}", parent=self)
+            return
+
+        if self.data_manager.add_data(df):
+            self.status_label.config(text=f"{len(df)} records successfully uploaded and saved!", fg="green")
             self.save_button.config(state=tk.DISABLED) # Disable after saving
             self.file_label.config(text="No file selected")
             self.preview_text.delete(1.0, tk.END)
             messagebox.showinfo("Import Success", "Data imported and saved successfully!", parent=self)
-            self.master.dashboard_page.update_summary() # Update dashboard summary
-            self.master.update_all_page_dropdowns() # Update dropdowns in all open pages
+            self.master.request_page_refresh() # Update dashboard summary and dropdowns in all open pages
         else:
             self.status_label.config(text="Data upload failed. Check console for errors.", fg="red")
 
@@ -1241,6 +1777,13 @@ class DataExportPage(BasePage):
     """
     Allows users to export processed/filtered data to various formats.
     """
+    # Save dialog file type filters for each export format
+    FILE_TYPES = {
+        "csv": [("CSV files", "*.csv")],
+        "xlsx": [("Excel files", "*.xlsx")],
+        "pdf": [("PDF files", "*.pdf")]
+    }
+
     def __init__(self, master, data_manager):
         super().__init__(master, data_manager, "Data Export")
 
@@ -1252,12 +1795,12 @@ class DataExportPage(BasePage):
 
         tk.Label(filter_frame, text="Branch:").grid(row=0, column=0, padx=5)
         self.branch_var = tk.StringVar(self)
-        self.branch_dropdown = tk.OptionMenu(filter_frame, self.branch_var, "Loading...")
+        self.branch_dropdown = self.create_dropdown(filter_frame, self.branch_var)
         self.branch_dropdown.grid(row=0, column=1, padx=5)
 
         tk.Label(filter_frame, text="Product:").grid(row=0, column=2, padx=5)
         self.product_var = tk.StringVar(self)
-        self.product_dropdown = tk.OptionMenu(filter_frame, self.product_var, "Loading...")
+        self.product_dropdown = self.create_dropdown(filter_frame, self.product_var)
         self.product_dropdown.grid(row=0, column=3, padx=5)
 
         tk.Label(filter_frame, text="Start Date (YYYY-MM-DD):").grid(row=1, column=0, padx=5, pady=5)
@@ -1277,36 +1820,22 @@ class DataExportPage(BasePage):
         tk.Button(export_button_frame, text="Export as Excel", command=lambda: self.export_data("xlsx"), font=("Arial", 10), bg="#28a745", fg="white").pack(side="left", padx=10)
         tk.Button(export_button_frame, text="Export as PDF (Summary)", command=lambda: self.export_data("pdf"), font=("Arial", 10), bg="#dc3545", fg="white").pack(side="left", padx=10)
 
+        self.split_var = tk.BooleanVar(self, value=False)
+        tk.Checkbutton(self, text="Save one file per branch (CSV/Excel)", variable=self.split_var).pack()
+
         self.status_label = tk.Label(self, text="", fg="blue", font=("Arial", 10))
         self.status_label.pack(pady=10)
-        self.refresh_dropdowns() # Initial population of dropdowns
+        self.after_idle(self.refresh_dropdowns) # Initial population of dropdowns, once the window has been drawn
 
     def refresh_dropdowns(self):
         """Populates or updates the branch and product dropdowns."""
         branches = ["All Branches"] + self.data_manager.get_branches()
         products = ["All Products"] + self.data_manager.get_products()
 
-        # Update Branch Dropdown
-        self.branch_dropdown['menu'].delete(0, 'end')
-        for branch in branches:
-            self.branch_dropdown['menu'].add_command(label=branch, command=tk._setit(self.branch_var, branch))
-        if branches:
-            self.branch_var.set(branches[0])
-        else:
-            self.branch_var.set("No Branches Available")
-            self.branch_dropdown.config(state=tk.DISABLED)
-
-        # Update Product Dropdown
-        self.product_dropdown['menu'].delete(0, 'end')
-        for product in products:
-            self.product_dropdown['menu'].add_command(label=product, command=tk._setit(self.product_var, product))
-        if products:
-            self.product_var.set(products[0])
-        else:
-            self.product_var.set("No Products Available")
-            self.product_dropdown.config(state=tk.DISABLED)
+        self.populate_dropdown(self.branch_dropdown, self.branch_var, branches, "No Branches Available")
+        self.populate_dropdown(self.product_dropdown, self.product_var, products, "No Products Available")
 
-        state = tk.NORMAL if not self.data_manager.sales_data.empty else tk.DISABLED
+        state = "readonly" if not self.data_manager.sales_data.empty else tk.DISABLED
         self.branch_dropdown.config(state=state)
         self.product_dropdown.config(state=state)
 
@@ -1329,57 +1858,39 @@ class DataExportPage(BasePage):
                 messagebox.showerror("Input Error", "Start date cannot be after end date.", parent=self)
                 return
 
-            filtered_df = self.data_manager.sales_data.copy()
-
-            if selected_branch != "All Branches":
-                filtered_df = filtered_df[filtered_df['Branch'] == selected_branch]
-            if selected_product != "All Products":
-                filtered_df = filtered_df[filtered_df['Product'] == selected_product]
-
-            filtered_df = filtered_df[(filtered_df['Date'] >= start_date) & (filtered_df['Date'] <= end_date)]
+            filtered_df = self.data_manager.get_export_data(start_date, end_date, branch=selected_branch, product=selected_product)
 
             if filtered_df.empty:
                 messagebox.showwarning("No Data", "No data found for the selected filters to export.", parent=self)
                 return
 
-            file_types = {
-                "csv": [("CSV files", "*.csv")],
-                "xlsx": [("Excel files", "*.xlsx")],
-                "pdf": [("PDF files", "*.pdf")]
-            }
             default_ext = "." + file_format
             file_path = filedialog.asksaveasfilename(
                 defaultextension=default_ext,
-                filetypes=file_types.get(file_format, [("All files", "*.*")]),
+                filetypes=self.FILE_TYPES.get(file_format, [("All files", "*.*")]),
                 title=f"Save Data as {file_format.upper()}"
             )
 
             if file_path:
                 if file_format == "csv":
-                    filtered_df.to_csv(file_path, index=False)
+                    writer = _write_csv
                 elif file_format == "xlsx":
-                    filtered_df.to_excel(file_path, index=False)
-                elif file_format == "pdf":
+                    writer = _write_excel
+                else:
                     # For PDF export, we'll save a simple table summary of the data.
-                    # Full dataframe to PDF is complex and typically requires external libraries like ReportLab or FPDF.
-                    fig, ax = plt.subplots(figsize=(11, 8.5)) # Standard paper size
-                    ax.axis('off')
-                    ax.set_title(f"Sales Data Export ({start_date_str} to {end_date_str})", fontsize=14, pad=20)
-
-                    # Prepare data for table: limit columns and rows for readability in PDF
-                    display_df = filtered_df.head(20).copy() # Show first 20 rows
-                    if 'Date' in display_df.columns:
-                        display_df['Date'] = display_df['Date'].dt.strftime('%Y-%m-%d') # Format date for display
-
-                    table = ax.table(cellText=display_df.values, colLabels=display_df.columns, loc='center', cellLoc='left')
-                    table.auto_set_font_size(False)
-                    table.set_fontsize(8)
-                    table.scale(1.2, 1.2) # Adjust size
-
-                    fig.savefig(file_path, bbox_inches='tight', pad_inches=0.5)
-                    plt.close(fig) # Close the figure to free memory
-
-                self.status_label.config(text=f"Report downloaded successfully to {file_path}!")
+                    title = f"Sales Data Export ({start_date_str} to {end_date_str})"
+                    writer = functools.partial(_write_pdf_summary, title=title)
+                shown_path = file_path
+                if self.split_var.get() and file_format != "pdf":
+                    writer = functools.partial(_write_partitioned, writer, column='Branch')
+                    stem, ext = os.path.splitext(file_path)
+                    shown_path = f"{stem}_<branch>{ext}"
+                # Large exports take seconds to format and write, so the file is written on the
+                # worker thread while the window stays responsive
+                self.status_label.config(text="Exporting...", fg="blue")
+                self.run_in_background(writer, filtered_df, file_path,
+                                       on_done=lambda _: self._show_export_done(shown_path),
+                                       on_error=self._show_export_failed)
             else:
                 self.status_label.config(text="Export cancelled.", fg="orange")
 
@@ -1388,6 +1899,15 @@ class DataExportPage(BasePage):
         except Exception as e:
             messagebox.showerror("Export Error", f"An error occurred during export: {e}", parent=self)
 
+    def _show_export_done(self, file_path):
+        """Reports a finished export in the status label."""
+        self.status_label.config(text=f"Report downloaded successfully to {file_path}!", fg="green")
+
+    def _show_export_failed(self, error):
+        """Reports an export whose file could not be written, in the status label and a message box."""
+        self.status_label.config(text="Export failed.", fg="red")
+        messagebox.showerror("Export Error", f"An error occurred during export: {error}", parent=self)
+
 # --- 10. Settings Page (Optional) ---
 class SettingsPage(BasePage):
     """
@@ -1449,6 +1969,7 @@ class MainApp(tk.Tk):
 
         # Keep track of open analysis pages to update their dropdowns
         self.open_analysis_windows = []
+        self._refresh_pending = False # True while an update_all_page_dropdowns call is scheduled
         self.bind("<Map>", self._on_window_map) # Event to track when a Toplevel window is opened
 
         self.show_login()
@@ -1480,6 +2001,20 @@ class MainApp(tk.Tk):
         self.dashboard_page = DashboardPage(self, self.data_manager, user_role)
         self.dashboard_page.lift() # Bring to front
 
+    def request_page_refresh(self):
+        """
+        Schedules update_all_page_dropdowns for when the event loop is next idle. Requests made
+        before then are coalesced, so a burst of imports refreshes the open pages only once.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._run_page_refresh)
+
+    def _run_page_refresh(self):
+        """Runs the refresh scheduled by request_page_refresh."""
+        self._refresh_pending = False
+        self.update_all_page_dropdowns()
+
     def update_all_page_dropdowns(self):
         """
         Triggers the refresh of dropdowns in all currently open analysis pages.
@@ -1,25 +1,44 @@
 import os
 import sys
+import tempfile
+import time
 import unittest
-import coverage
+import numpy as np
 import pandas as pd
 from tkinter import Tk
-from main import DataManager, MonthlySalesPage
+from main import DataManager, MonthlySalesPage, _cached_query, _write_csv, _write_excel, _write_partitioned
+
+try:
+    import openpyxl # Optional: only needed for Excel export
+except ImportError:
+    openpyxl = None
+
+try:
+    import pyarrow # Optional: only needed for the Parquet store
+except ImportError:
+    pyarrow = None
 
 # --- UNIT TESTS: DataManager ---
 class TestDataManager(unittest.TestCase):
-    def setUp(self):
-        self.manager = DataManager(data_file="test_sales_data.csv")
-        if self.manager.sales_data.empty:
-            test_data = pd.DataFrame({
-                "Date": pd.to_datetime(["2024-06-01", "2024-06-02"]),
-                "Branch": ["Colombo", "Kandy"],
-                "Product": ["Milk", "Bread"],
-                "Quantity": [5, 10],
-                "UnitPrice": [150, 50],
-                "Total": [750, 500]
-            })
-            self.manager.add_data(test_data)
+    @classmethod
+    def setUpClass(cls):
+        # Loaded once for the whole class; tests that add data restore the table afterwards.
+        # The store lives in a fresh temporary directory, so runs never share or leave behind a data file.
+        cls.data_dir = tempfile.TemporaryDirectory()
+        cls.manager = DataManager(data_file=os.path.join(cls.data_dir.name, "test_sales_data.csv"))
+        test_data = pd.DataFrame({
+            "Date": pd.to_datetime(["2024-06-01", "2024-06-02"]),
+            "Branch": ["Colombo", "Kandy"],
+            "Product": ["Milk", "Bread"],
+            "Quantity": [5, 10],
+            "UnitPrice": [150, 50],
+            "Total": [750, 500]
+        })
+        cls.manager.add_data(test_data)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.data_dir.cleanup()
 
     def test_load_data_returns_dataframe(self):
         self.assertIsInstance(self.manager.sales_data, pd.DataFrame)
@@ -29,6 +48,8 @@ class TestDataManager(unittest.TestCase):
         self.assertIsInstance(branches, list)
 
     def test_add_data_valid(self):
+        saved_data = self.manager.sales_data
+        self.addCleanup(setattr, self.manager, "sales_data", saved_data)
         new_data = pd.DataFrame({
             "Date": ["2024-06-03"],
             "Branch": ["Colombo"],
@@ -40,6 +61,50 @@ class TestDataManager(unittest.TestCase):
         result = self.manager.add_data(new_data)
         self.assertTrue(result)
 
+    def test_add_data_keeps_unit_price_precision(self):
+        manager = DataManager(data_file=None)
+        manager.add_data(pd.DataFrame({
+            "Date": ["2024-06-03"],
+            "Branch": ["Colombo"],
+            "Product": ["Eggs"],
+            "Quantity": [2],
+            "UnitPrice": [150.1],
+            "Total": [300.2]
+        }))
+        self.assertEqual(manager.sales_data["UnitPrice"].iloc[0], 150.1)
+
+    def test_add_data_with_numeric_keys(self):
+        manager = DataManager(data_file=None)
+        manager.add_data(pd.DataFrame({
+            "Date": ["2024-06-01"], "Branch": ["Colombo"], "Product": ["Milk"],
+            "Quantity": [1], "UnitPrice": [150], "Total": [150]
+        }))
+        # Branch and product codes as an Excel sheet may deliver them: integers, or mixed with text
+        result = manager.add_data(pd.DataFrame({
+            "Date": ["2024-06-02", "2024-06-03"], "Branch": [101, 102], "Product": [7, "Bread"],
+            "Quantity": [2, 3], "UnitPrice": [50, 60], "Total": [100, 180]
+        }))
+        self.assertTrue(result)
+        self.assertEqual(manager.get_branches(), ["101", "102", "Colombo"])
+        self.assertEqual(manager.get_products(), ["7", "Bread", "Milk"])
+        self.assertEqual(len(manager.sales_data), 3)
+
+    def test_sales_summary_follows_data_changes(self):
+        manager = DataManager(data_file=None)
+        manager.add_data(pd.DataFrame({
+            "Date": ["2024-06-01", "2024-06-02"], "Branch": ["Colombo", "Kandy"], "Product": ["Milk", "Bread"],
+            "Quantity": [5, 10], "UnitPrice": [150, 50], "Total": [750, 500]
+        }))
+        self.assertEqual(manager.get_sales_summary(), (1250, "Milk"))
+        original_data = manager.sales_data
+        manager.add_data(pd.DataFrame({
+            "Date": ["2024-06-03"], "Branch": ["Kandy"], "Product": ["Bread"],
+            "Quantity": [6], "UnitPrice": [50], "Total": [300]
+        }))
+        self.assertEqual(manager.get_sales_summary(), (1550, "Bread"))
+        manager.sales_data = original_data
+        self.assertEqual(manager.get_sales_summary(), (1250, "Milk"))
+
     def test_get_products_returns_list(self):
         products = self.manager.get_products()
         self.assertIsInstance(products, list)
@@ -52,25 +117,184 @@ class TestDataManager(unittest.TestCase):
         report = self.manager.get_monthly_sales(branch="All Branches", year=2024, month=None)
         self.assertIsInstance(report, pd.DataFrame)
 
+    def test_result_of_query_overtaken_by_data_change_is_not_cached(self):
+        class ChangingManager(DataManager):
+            @_cached_query
+            def row_count(self):
+                count = len(self.sales_data)
+                self.sales_data = self.sales_data.iloc[:0] # As if an import finished while the query ran
+                return count
+
+        manager = ChangingManager(data_file=None)
+        manager.sales_data = self.manager.sales_data
+        self.assertEqual(manager.row_count(), len(self.manager.sales_data))
+        self.assertEqual(manager.row_count(), 0)
+
+    def test_query_results_cached_until_data_changes(self):
+        saved_data = self.manager.sales_data
+        self.addCleanup(setattr, self.manager, "sales_data", saved_data)
+        report = self.manager.get_monthly_sales(branch="All Branches", year=2024, month=None)
+        self.assertIs(self.manager.get_monthly_sales(branch="All Branches", year=2024, month=None), report)
+        self.manager.sales_data = saved_data.copy()
+        self.assertIsNot(self.manager.get_monthly_sales(branch="All Branches", year=2024, month=None), report)
+
+# --- UNIT TESTS: data file storage ---
+STORE_HEADER = "Date,Branch,Product,Quantity,UnitPrice,Total\n"
+STORE_ROW = "2024-06-01,Colombo,Milk,5,150.0,750\n"
+
+class TestDataStorage(unittest.TestCase):
+    NEW_ROW = {
+        "Date": ["2024-06-02"], "Branch": ["Kandy"], "Product": ["Bread"],
+        "Quantity": [3], "UnitPrice": [60], "Total": [180]
+    }
+
+    def setUp(self):
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.data_dir.cleanup)
+        self.data_file = os.path.join(self.data_dir.name, "sales_data.csv")
+
+    def write_store(self, text):
+        with open(self.data_file, "w", newline="") as f:
+            f.write(text)
+
+    def read_store(self):
+        with open(self.data_file, newline="") as f:
+            return f.read()
+
+    def import_new_row(self, manager=None, **extra_columns):
+        manager = manager or DataManager(data_file=self.data_file)
+        self.assertTrue(manager.add_data(pd.DataFrame({**self.NEW_ROW, **extra_columns})))
+
+    def assert_store_reloads(self):
+        reloaded = DataManager(data_file=self.data_file).sales_data
+        self.assertEqual(reloaded["Product"].tolist(), ["Milk", "Bread"])
+        self.assertEqual(reloaded["Total"].tolist(), [750, 180])
+
+    def test_import_appends_to_matching_csv(self):
+        self.write_store(STORE_HEADER + STORE_ROW)
+        self.import_new_row()
+        # Appended: the existing lines are untouched and exactly one line follows them
+        contents = self.read_store()
+        self.assertTrue(contents.startswith(STORE_HEADER + STORE_ROW))
+        self.assertEqual(contents[len(STORE_HEADER + STORE_ROW):].count("\n"), 1)
+        self.assert_store_reloads()
+
+    def test_import_rewrites_csv_with_mismatched_header(self):
+        self.write_store(STORE_HEADER + STORE_ROW)
+        manager = DataManager(data_file=self.data_file)
+        # The file changed on disk after loading: its columns no longer line up with the table's
+        self.write_store("Date,Branch,Product,Qty,UnitPrice,Total\n" + STORE_ROW)
+        self.import_new_row(manager)
+        self.assertTrue(self.read_store().startswith(STORE_HEADER))
+        self.assert_store_reloads()
+
+    def test_import_with_extra_column_rewrites_csv(self):
+        self.write_store(STORE_HEADER + STORE_ROW)
+        self.import_new_row(Notes=["promo"])
+        self.assertTrue(self.read_store().startswith(STORE_HEADER.rstrip("\n") + ",Notes\n"))
+        self.assert_store_reloads()
+
+    def test_import_rewrites_csv_without_trailing_newline(self):
+        self.write_store(STORE_HEADER + STORE_ROW.rstrip("\n"))
+        self.import_new_row()
+        self.assertEqual(len(self.read_store().splitlines()), 3)
+        self.assert_store_reloads()
+
+    def test_header_only_store_loads_empty(self):
+        self.write_store(STORE_HEADER)
+        manager = DataManager(data_file=self.data_file)
+        self.assertTrue(manager.sales_data.empty)
+        self.import_new_row(manager)
+        reloaded = DataManager(data_file=self.data_file).sales_data
+        self.assertEqual(reloaded["Product"].tolist(), ["Bread"])
+
+    def test_store_without_valid_rows_loads_empty(self):
+        self.write_store(STORE_HEADER + "2024-06-01,Colombo,Milk,5,150.0,\n")
+        self.assertTrue(DataManager(data_file=self.data_file).sales_data.empty)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_legacy_csv_is_migrated_to_parquet(self):
+        self.write_store(STORE_HEADER + STORE_ROW)
+        parquet_file = os.path.splitext(self.data_file)[0] + ".parquet"
+        manager = DataManager(data_file=parquet_file)
+        self.assertTrue(os.path.exists(parquet_file))
+        self.assertEqual(manager.sales_data["Product"].tolist(), ["Milk"])
+        # The migrated store is read on its own from now on
+        os.remove(self.data_file)
+        self.assertEqual(DataManager(data_file=parquet_file).sales_data["Total"].tolist(), [750])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_parquet_store_round_trips(self):
+        parquet_file = os.path.splitext(self.data_file)[0] + ".parquet"
+        manager = DataManager(data_file=parquet_file)
+        manager.add_data(pd.DataFrame({
+            "Date": ["2024-06-01", "2024-06-02"], "Branch": ["Colombo", "Kandy"], "Product": ["Milk", "Bread"],
+            "Quantity": [5, 3], "UnitPrice": [150.1, 60], "Total": [750.5, 180]
+        }))
+        reloaded = DataManager(data_file=parquet_file).sales_data
+        pd.testing.assert_frame_equal(reloaded, manager.sales_data)
+
+# Sales shared by the analysis and GUI tests
+ANALYSIS_SEED = {
+    "Date": ["2024-06-01", "2024-06-02", "2024-06-03", "2024-06-04"],
+    "Branch": ["Colombo", "Kandy", "Colombo", "Kandy"],
+    "Product": ["Milk", "Bread", "Milk", "Eggs"],
+    "Quantity": [5, 10, 2, 12],
+    "UnitPrice": [150, 50, 160, 30],
+    "Total": [750, 500, 320, 360]
+}
+
 # --- NEW TESTS: Analytical Features ---
 class TestAnalysisMethods(unittest.TestCase):
-    def setUp(self):
-        self.manager = DataManager(data_file="test_sales_data.csv")
-        if self.manager.sales_data.empty:
-            test_data = pd.DataFrame({
-                "Date": pd.to_datetime(["2024-06-01", "2024-06-02", "2024-06-03", "2024-06-04"]),
-                "Branch": ["Colombo", "Kandy", "Colombo", "Kandy"],
-                "Product": ["Milk", "Bread", "Milk", "Eggs"],
-                "Quantity": [5, 10, 2, 12],
-                "UnitPrice": [150, 50, 160, 30],
-                "Total": [750, 500, 320, 360]
-            })
-            self.manager.add_data(test_data)
+    # Date range shared by the date-filtered queries below
+    START = pd.Timestamp("2024-06-01")
+    END = pd.Timestamp("2024-06-07")
+
+    @classmethod
+    def setUpClass(cls):
+        # In-memory store seeded once: the queries below never touch the disk
+        cls.manager = DataManager(data_file=None)
+        cls.manager.add_data(pd.DataFrame(ANALYSIS_SEED))
 
     def test_monthly_sales_analysis(self):
         df = self.manager.get_monthly_sales(branch="Colombo", year=2024, month=6)
-        self.assertFalse(df.empty)
-        self.assertIn("Product", df.columns)
+        self.assertEqual(df.to_dict("list"), {
+            "Product": ["Milk"], "Quantity": [7], "UnitPrice": [155], "Total": [1070]
+        })
+
+    def test_monthly_sales_all_branches(self):
+        df = self.manager.get_monthly_sales(branch="All Branches", year=2024, month=6)
+        self.assertEqual(df.to_dict("list"), {
+            "Product": ["Bread", "Eggs", "Milk"],
+            "Quantity": [10, 12, 7],
+            "UnitPrice": [50, 30, 155],
+            "Total": [500, 360, 1070]
+        })
+
+    def test_monthly_unit_price_averages_every_sale(self):
+        manager = DataManager(data_file=None)
+        manager.add_data(pd.DataFrame({
+            "Date": ["2024-06-01", "2024-06-02", "2024-06-03"],
+            "Branch": ["Colombo", "Colombo", "Kandy"],
+            "Product": ["Milk", "Milk", "Milk"],
+            "Quantity": [5, 1, 2],
+            "UnitPrice": [150.0, 170.0, 175.0],
+            "Total": [750.0, 170.0, 350.0]
+        }))
+        df = manager.get_monthly_sales(branch="All Branches", year=2024, month=6)
+        # The mean over all three sales, not the mean of the per-branch averages (167.5)
+        self.assertEqual(df.to_dict("list"), {
+            "Product": ["Milk"], "Quantity": [8], "UnitPrice": [165.0], "Total": [1270.0]
+        })
+
+    def test_monthly_unit_price_of_integer_prices_keeps_fraction(self):
+        manager = DataManager(data_file=None)
+        manager.add_data(pd.DataFrame({
+            "Date": ["2024-06-01", "2024-06-02"], "Branch": ["Colombo", "Kandy"], "Product": ["Milk", "Milk"],
+            "Quantity": [1, 1], "UnitPrice": [150, 155], "Total": [150, 155]
+        }))
+        df = manager.get_monthly_sales(branch="All Branches", year=2024, month=6)
+        self.assertEqual(df["UnitPrice"].tolist(), [152.5])
 
     def test_price_analysis(self):
         df = self.manager.get_product_price_history("Milk")
@@ -78,71 +302,160 @@ class TestAnalysisMethods(unittest.TestCase):
         self.assertIn("UnitPrice", df.columns)
 
     def test_weekly_sales_analysis(self):
-        start = pd.Timestamp("2024-06-01")
-        end = pd.Timestamp("2024-06-07")
-        df = self.manager.get_weekly_sales(start, end, branch="All Branches")
-        self.assertFalse(df.empty)
-        self.assertIn("DayOfWeek", df.columns)
+        df = self.manager.get_weekly_sales(self.START, self.END, branch="All Branches")
+        # 2024-06-01 is a Saturday
+        self.assertEqual(df.to_dict("list"), {
+            "DayOfWeek": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
+            "Total": [320, 360, 0, 0, 0, 750, 500]
+        })
+
+    def test_weekly_sales_for_one_branch(self):
+        df = self.manager.get_weekly_sales(self.START, self.END, branch="Kandy")
+        self.assertEqual(df["Total"].tolist(), [0, 360, 0, 0, 0, 0, 500])
 
     def test_product_preference_analysis(self):
-        start = pd.Timestamp("2024-06-01")
-        end = pd.Timestamp("2024-06-07")
-        df = self.manager.get_product_preferences(date_range=(start, end), branch="All Branches")
+        df = self.manager.get_product_preferences(date_range=(self.START, self.END), branch="All Branches")
         self.assertFalse(df.empty)
         self.assertIn("Product", df.columns)
 
     def test_sales_distribution_analysis(self):
-        start = pd.Timestamp("2024-06-01")
-        end = pd.Timestamp("2024-06-07")
-        series = self.manager.get_sales_distribution(date_range=(start, end), branch="All Branches")
+        series = self.manager.get_sales_distribution(date_range=(self.START, self.END), branch="All Branches")
         self.assertFalse(series.empty)
         self.assertIsInstance(series, pd.Series)
 
+    def test_sales_distribution_stats_analysis(self):
+        stats = self.manager.get_sales_distribution_stats(date_range=(self.START, self.END), branch="All Branches")
+        self.assertIn("mode", stats.index)
+        self.assertFalse(pd.isna(stats["mean"]))
+
+    def test_export_data_filters_rows(self):
+        df = self.manager.get_export_data(self.START, self.END, branch="Colombo", product="All Products")
+        self.assertFalse(df.empty)
+        self.assertTrue((df["Branch"] == "Colombo").all())
+        self.assertNotIn("Year", df.columns)
+
+# --- EXPORT WRITERS ---
+class TestExportWriters(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.data_dir.cleanup)
+
+    @unittest.skipIf(openpyxl is None, "openpyxl is not installed")
+    def test_excel_export_round_trips_values(self):
+        df = pd.DataFrame({
+            "Date": pd.to_datetime(["2024-06-01", "2024-06-02"]),
+            "Product": pd.Categorical(["Milk", "Bread"]),
+            "Quantity": np.array([5, 10], dtype="int32"),
+            "UnitPrice": np.array([150.1, 49.99], dtype="float32"),
+            "Total": [750.5, 499.9]
+        })
+        file_path = os.path.join(self.data_dir.name, "export.xlsx")
+        _write_excel(df, file_path)
+        read_back = pd.read_excel(file_path)
+        self.assertEqual(list(read_back.columns), list(df.columns))
+        self.assertEqual(read_back["UnitPrice"].tolist(), [150.1, 49.99])
+        self.assertEqual(read_back["Total"].tolist(), [750.5, 499.9])
+        self.assertEqual(read_back["Product"].tolist(), ["Milk", "Bread"])
+        self.assertEqual(read_back["Quantity"].tolist(), [5, 10])
+
+    def test_csv_export_matches_pandas_output(self):
+        df = pd.DataFrame({
+            "Date": pd.to_datetime(["2024-06-01", "2024-06-02"]),
+            "Branch": pd.Categorical(["Colombo", "Kandy, Hill"]),
+            "Product": ["Milk", 'Bread "Large"'],
+            "Quantity": np.array([5, 10], dtype="int32"),
+            "UnitPrice": [150.0, 49.99],
+            "Total": [750.0, 499.9]
+        })
+        file_path = os.path.join(self.data_dir.name, "export.csv")
+        _write_csv(df, file_path)
+        with open(file_path, newline="") as f:
+            self.assertEqual(f.read(), df.to_csv(index=False))
+
+    def test_split_export_sanitizes_branch_names(self):
+        df = pd.DataFrame({
+            "Branch": pd.Categorical(["Colombo/North", "Colombo:North", "Kandy"]),
+            "Total": [750, 320, 500]
+        })
+        _write_partitioned(_write_csv, df, os.path.join(self.data_dir.name, "export.csv"), "Branch")
+        self.assertEqual(sorted(os.listdir(self.data_dir.name)),
+                         ["export_Colombo_North.csv", "export_Colombo_North_2.csv", "export_Kandy.csv"])
+        totals = {name: pd.read_csv(os.path.join(self.data_dir.name, name))["Total"].tolist()
+                  for name in os.listdir(self.data_dir.name)}
+        self.assertEqual(totals, {
+            "export_Colombo_North.csv": [750], "export_Colombo_North_2.csv": [320], "export_Kandy.csv": [500]
+        })
+
 # --- OPTIONAL: GUI Test (Skipped in CI or headless) ---
 @unittest.skipIf(os.environ.get("CI") == "true" or os.environ.get("DISPLAY") is None, "Skip GUI tests in CI or headless environment")
 class TestMonthlySalesPageIntegration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.root = Tk()
+        cls.root.withdraw()
+        # Seeded in memory: an empty store would make generate_report stop at a modal "No Data" dialog
+        cls.data_manager = DataManager(data_file=None)
+        cls.data_manager.add_data(pd.DataFrame(ANALYSIS_SEED))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.root.destroy()
+
     def setUp(self):
-        self.root = Tk()
-        self.data_manager = DataManager(data_file="test_sales_data.csv")
         self.page = MonthlySalesPage(self.root, self.data_manager)
 
+    def wait_for_background_task(self, timeout=5):
+        """Runs the Tk event loop until the page's worker result has been delivered (busy cursor cleared)."""
+        deadline = time.monotonic() + timeout
+        while str(self.page.cget("cursor")) == "watch":
+            self.assertLess(time.monotonic(), deadline, "background task did not finish")
+            self.page.update()
+            time.sleep(0.01)
+
     def test_generate_report_with_valid_filters(self):
         self.page.branch_var.set("Colombo")
         self.page.year_var.set("2024")
         self.page.month_var.set("All Months")
         self.page.generate_report()
-        tree_items = self.page.tree.get_children()
-        self.assertGreaterEqual(len(tree_items), 0)
+        self.wait_for_background_task()
+        rows = [tuple(str(value) for value in self.page.tree.item(item, "values")) for item in self.page.tree.get_children()]
+        self.assertEqual(rows, [("Milk", "7", "Rs. 155.00", "Rs. 1070.00")])
 
     def tearDown(self):
-        self.root.destroy()
+        self.page.on_close() # Also shuts down the page's worker thread
+        self.root.withdraw() # on_close shows the main window again
 
 # --- RUNNER ---
-def run_tests_with_coverage():
-    cov = coverage.Coverage(source=["main"])
-    cov.start()
+def run_tests(coverage_enabled=False):
+    # Coverage tracing slows every line of main, so it only runs when asked for (COVERAGE=1, as in CI)
+    if coverage_enabled:
+        if sys.version_info >= (3, 12):
+            # sys.monitoring (PEP 669) measures far more cheaply than the settrace-based tracer
+            os.environ.setdefault("COVERAGE_CORE", "sysmon")
+        import coverage
+        cov = coverage.Coverage(source=["main"])
+        cov.start()
 
     loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    suite.addTests(loader.loadTestsFromTestCase(TestDataManager))
-    suite.addTests(loader.loadTestsFromTestCase(TestAnalysisMethods))
-    suite.addTests(loader.loadTestsFromTestCase(TestMonthlySalesPageIntegration))
+    test_cases = (TestDataManager, TestDataStorage, TestAnalysisMethods, TestExportWriters, TestMonthlySalesPageIntegration)
+    suite = unittest.TestSuite(loader.loadTestsFromTestCase(case) for case in test_cases)
 
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
 
-    cov.stop()
-    cov.save()
+    if coverage_enabled:
+        cov.stop()
+        cov.save()
 
-    print("\n--- CODE COVERAGE REPORT ---\n")
-    cov.report()
-    cov.html_report(directory="coverage_report")
-    print(f"HTML report saved to {os.path.abspath('coverage_report/index.html')}")
+        print("\n--- CODE COVERAGE REPORT ---\n")
+        cov.report()
+        cov.html_report(directory="coverage_report")
+        print(f"HTML report saved to {os.path.abspath('coverage_report/index.html')}")
     return result
 
 if __name__ == "__main__":
     print("🚀 Running unit and integration tests...\n")
-    test_result = run_tests_with_coverage()
+    test_result = run_tests(coverage_enabled=os.environ.get("COVERAGE") == "1")
     if test_result.wasSuccessful():
         print("\n✅ All tests passed!")
     else: